@@ -3,6 +3,9 @@ import random
 import sys
 import math
 import os
+import hashlib
+import inspect
+import wave
 
 # 初始化pygame
 pygame.init()
@@ -14,10 +17,17 @@ SCREEN_WIDTH = 800
 SCREEN_HEIGHT = 600
 FPS = 60
 
+# 屏幕中心/提示行等常用坐标常量（绘制热路径里反复用到，预先算好）
+CX = SCREEN_WIDTH // 2
+CY = SCREEN_HEIGHT // 2
+BOTTOM_HINT_Y = SCREEN_HEIGHT - 80   # 界面底部第一行操作提示
+BOTTOM_HINT_Y2 = SCREEN_HEIGHT - 50  # 界面底部第二行操作提示
+
 # 资源路径
 ASSETS_DIR = os.path.join(os.path.dirname(__file__), 'assets')
 IMAGES_DIR = os.path.join(ASSETS_DIR, 'images')
 SOUNDS_DIR = os.path.join(ASSETS_DIR, 'sounds')
+CACHE_DIR = os.path.join(ASSETS_DIR, 'cache')
 
 # 资源加载器类
 class AssetLoader:
@@ -65,6 +75,143 @@ class AssetLoader:
         print(f"[INFO] 未找到音乐文件: {filename}，将使用程序合成音乐")
         return False
 
+class _RandPool:
+    """预生成的随机数池 - numpy一次性批量生成，热路径逐个取用，
+    摊销random模块逐次调用的Python层开销"""
+
+    _SIZE = 8192
+
+    def __init__(self):
+        import numpy as np
+        self._np = np
+        self._vals = np.random.random(self._SIZE)
+        self._idx = 0
+
+    def _next(self):
+        if self._idx >= self._SIZE:
+            self._vals = self._np.random.random(self._SIZE)
+            self._idx = 0
+        value = self._vals[self._idx]
+        self._idx += 1
+        return value
+
+    def uniform(self, a, b):
+        """等价于random.uniform(a, b)"""
+        return a + (b - a) * self._next()
+
+    def randint(self, a, b):
+        """等价于random.randint(a, b)，包含两端"""
+        return a + int(self._next() * (b - a + 1))
+
+# 供各处热路径共享的随机数池
+_rand_pool = _RandPool()
+
+# pygame-ce提供更快的fblits批量blit接口；标准pygame退回blits
+_HAS_FBLITS = hasattr(pygame.Surface, 'fblits')
+
+def batch_blit(surface, blit_seq):
+    """把(精灵, 位置)序列一次性批量blit到目标Surface"""
+    if _HAS_FBLITS:
+        surface.fblits(blit_seq)
+    else:
+        surface.blits(blit_seq, doreturn=False)
+
+# 整屏半透明遮罩的惰性单例：暂停/倒计时共用同一份，首次使用时构建
+_DIM_OVERLAY = None
+
+def get_dim_overlay():
+    """取整屏128-alpha黑色遮罩（惰性构建，全局只有一份）"""
+    global _DIM_OVERLAY
+    if _DIM_OVERLAY is None:
+        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+        overlay.set_alpha(128)
+        overlay.fill(BLACK)
+        _DIM_OVERLAY = overlay
+    return _DIM_OVERLAY
+
+# 256档正弦查表：动画相位的sin只需一次取模索引，
+# 替代每帧热路径里的math.sin调用（分辨率2π/256，视觉上无差别）
+_SIN_LUT_SIZE = 256
+_SIN_LUT = [math.sin(i * 2 * math.pi / _SIN_LUT_SIZE) for i in range(_SIN_LUT_SIZE)]
+
+def sin_lut(phase):
+    """查表近似sin(phase)"""
+    return _SIN_LUT[int(phase * (_SIN_LUT_SIZE / (2 * math.pi))) & (_SIN_LUT_SIZE - 1)]
+
+# 可选的numba加速：安装了numba时用JIT内核合成背景音乐，
+# 单次并行遍历即可完成，避免numpy路径中的多个大临时数组
+try:
+    import numba as _numba
+except ImportError:
+    _numba = None
+
+if _numba is not None:
+    import numpy as _np
+
+    @_numba.njit(parallel=True, fastmath=True, cache=True)
+    def _synth_bg_core(out, melody, note_duration, sample_rate, frames):
+        """背景音乐合成内核 - 逐样本计算但由numba编译为并行机器码"""
+        for i in _numba.prange(frames):
+            time = i / sample_rate
+            note_index = int(time / note_duration) % melody.size
+            freq = melody[note_index]
+            note_time = (time % note_duration) / note_duration
+
+            # 柔和的ADSR包络
+            if note_time < 0.15:
+                envelope = (note_time / 0.15) * 0.7
+            elif note_time < 0.75:
+                envelope = 0.7
+            else:
+                envelope = 0.7 * (1 - (note_time - 0.75) / 0.25)
+
+            # 主旋律 + 三度和声 + 低音衬托
+            wave = (math.sin(freq * 2 * math.pi * time) * 0.08
+                    + math.sin(freq * 1.25 * 2 * math.pi * time) * 0.04
+                    + math.sin(freq * 0.5 * 2 * math.pi * time) * 0.03) * envelope
+
+            # 颤音
+            wave *= 1 + 0.015 * math.sin(5 * 2 * math.pi * time)
+
+            # 钳位防止int16回绕
+            scaled = min(32767.0, max(-32768.0, wave * 32767))
+            sample = _np.int16(scaled)
+            out[i, 0] = sample
+            out[i, 1] = sample
+
+    @_numba.njit(fastmath=True, cache=True)
+    def _update_particles_core(x, y, vx, vy, life, noise):
+        """粒子更新内核 - 单次遍历融合位置/重力/寿命/扰动，无numpy临时数组"""
+        for i in range(x.size):
+            x[i] += vx[i]
+            y[i] += vy[i]
+            vy[i] += 0.2
+            life[i] -= 1
+            vx[i] += noise[i]
+
+    @_numba.njit(parallel=True, fastmath=True, cache=True)
+    def _grass_tips_core(blade_x, blade_angle, blade_height, wave_offset, screen_w, out_tx):
+        """草叶顶端x坐标计算内核 - 供草叶LUT构建按相位批量调用"""
+        for i in _numba.prange(blade_x.size):
+            local_wave = wave_offset * (0.7 + blade_x[i] / screen_w * 0.3)
+            out_tx[i] = (blade_x[i] + blade_angle[i] * blade_height[i]
+                         + local_wave * (1 + blade_height[i] / 30))
+
+    @_numba.njit(parallel=True, cache=True)
+    def _build_sky_pixels(out, width, height):
+        """并行填充天空渐变LUT像素，out形状为(亮度档数, W, H, 3)"""
+        for k in _numba.prange(out.shape[0]):
+            brightness = k - 5
+            for y in range(height):
+                ratio = y / height
+                r = min(255, max(0, int(160 + (200 - 160) * ratio + brightness)))
+                g = min(255, max(0, int(220 + (235 - 220) * ratio + brightness)))
+                b = min(255, max(0, 255 + brightness))
+                for x in range(width):
+                    out[k, x, y, 0] = r
+                    out[k, x, y, 1] = g
+                    out[k, x, y, 2] = b
+
 # 颜色定义
 WHITE = (255, 255, 255)
 BLACK = (0, 0, 0)
@@ -110,6 +257,23 @@ DIFFICULTY_SETTINGS = {
     }
 }
 
+# 难度参数的扁平化只读副本：构造小鸟/管道时直接元组解包，省去多次dict查找
+_BIRD_CFG = {name: (cfg["gravity"], cfg["jump_strength"])
+             for name, cfg in DIFFICULTY_SETTINGS.items()}
+_PIPE_CFG = {name: (cfg["pipe_speed"], cfg["pipe_gap"])
+             for name, cfg in DIFFICULTY_SETTINGS.items()}
+
+# 难度键的只读元组与各难度的文字说明（界面与事件处理共用的常量）
+DIFFICULTY_KEYS = tuple(DIFFICULTY_SETTINGS)
+DIFFICULTY_DESCRIPTIONS = {
+    "简单": "管道间距大，移动慢，适合新手",
+    "中等": "平衡的难度，适合大多数玩家",
+    "难": "管道间距小，移动快，极具挑战"
+}
+
+# 花朵的4种固定配色（不可变元组，避免每帧在绘制循环里重建列表）
+FLOWER_COLORS = ((255, 182, 193), (255, 20, 147), (255, 255, 0), (255, 165, 0))
+
 class SoundManager:
     def __init__(self):
         self.sounds = {}
@@ -127,58 +291,83 @@ class SoundManager:
         self.create_sounds()
         
     def create_sounds(self):
-        """创建改进的音效 - 使用numpy生成"""
+        """创建改进的音效 - 使用numpy生成，并缓存为wav文件"""
+        # 音效磁盘缓存：合成代码没有变化时直接读取上次保存的wav，
+        # 跳过所有合成计算；代码变更后key改变，缓存自动失效
+        cache_key = hashlib.sha1(
+            inspect.getsource(SoundManager).encode('utf-8')
+        ).hexdigest()[:16]
+        sound_names = ['jump', 'score', 'crash', 'powerup',
+                       'menu_select', 'menu_confirm', 'background', 'countdown']
+        wav_paths = {name: os.path.join(CACHE_DIR, f"{name}_{cache_key}.wav")
+                     for name in sound_names}
+
+        # 全部wav缓存命中时直接交给SDL_mixer原生解码，完全跳过numpy合成
+        if all(os.path.exists(path) for path in wav_paths.values()):
+            try:
+                for name, path in wav_paths.items():
+                    self.sounds[name] = pygame.mixer.Sound(path)
+                print("[OK] 音效缓存加载成功")
+                return
+            except pygame.error:
+                self.sounds = {}  # 缓存文件损坏，重新合成
+
         try:
             import numpy as np
-            
+
+            def load_or_generate(name, generate):
+                arr = generate()
+                try:
+                    os.makedirs(CACHE_DIR, exist_ok=True)
+                    with wave.open(wav_paths[name], 'wb') as wav_file:
+                        wav_file.setnchannels(2)
+                        wav_file.setsampwidth(2)  # int16
+                        wav_file.setframerate(22050)
+                        wav_file.writeframes(np.ascontiguousarray(arr).tobytes())
+                except OSError:
+                    pass  # 缓存目录不可写时不影响游戏
+                return arr
+
             # 跳跃音效 - 清脆的上升音调
-            jump_sound = pygame.sndarray.make_sound(
-                self.generate_chord([440, 554, 659], 0.15, 'sine')
+            self.sounds['jump'] = pygame.sndarray.make_sound(
+                load_or_generate('jump', lambda: self.generate_chord([440, 554, 659], 0.15, 'sine'))
             )
-            self.sounds['jump'] = jump_sound
-            
+
             # 得分音效 - 愉快的上升音阶
-            score_sound = pygame.sndarray.make_sound(
-                self.generate_melody([523, 659, 784, 1047], 0.3, 'sine')
+            self.sounds['score'] = pygame.sndarray.make_sound(
+                load_or_generate('score', lambda: self.generate_melody([523, 659, 784, 1047], 0.3, 'sine'))
             )
-            self.sounds['score'] = score_sound
-            
+
             # 碰撞音效 - 低沉的下降音调
-            crash_sound = pygame.sndarray.make_sound(
-                self.generate_tone(220, 0.4, 'sawtooth', decay=True)
+            self.sounds['crash'] = pygame.sndarray.make_sound(
+                load_or_generate('crash', lambda: self.generate_tone(220, 0.4, 'sawtooth', decay=True))
             )
-            self.sounds['crash'] = crash_sound
-            
+
             # 道具收集音效 - 魔法音效
-            powerup_sound = pygame.sndarray.make_sound(
-                self.generate_chord([659, 784, 988], 0.2, 'sine', vibrato=True)
+            self.sounds['powerup'] = pygame.sndarray.make_sound(
+                load_or_generate('powerup', lambda: self.generate_chord([659, 784, 988], 0.2, 'sine', vibrato=True))
             )
-            self.sounds['powerup'] = powerup_sound
-            
+
             # 菜单选择音效
-            menu_select = pygame.sndarray.make_sound(
-                self.generate_tone(330, 0.1, 'sine')
+            self.sounds['menu_select'] = pygame.sndarray.make_sound(
+                load_or_generate('menu_select', lambda: self.generate_tone(330, 0.1, 'sine'))
             )
-            self.sounds['menu_select'] = menu_select
-            
+
             # 菜单确认音效
-            menu_confirm = pygame.sndarray.make_sound(
-                self.generate_chord([440, 554], 0.15, 'sine')
+            self.sounds['menu_confirm'] = pygame.sndarray.make_sound(
+                load_or_generate('menu_confirm', lambda: self.generate_chord([440, 554], 0.15, 'sine'))
             )
-            self.sounds['menu_confirm'] = menu_confirm
-            
+
             # 背景音乐 - 简单的循环旋律
-            background_music = pygame.sndarray.make_sound(
-                self.generate_background_music()
+            self.sounds['background'] = pygame.sndarray.make_sound(
+                load_or_generate('background', self.generate_background_music)
             )
-            self.sounds['background'] = background_music
-            
+
             # 倒计时音效 - 清脆的提示音
-            countdown_sound = pygame.sndarray.make_sound(
-                self.generate_tone(800, 0.15, 'sine', decay=False)
+            self.sounds['countdown'] = pygame.sndarray.make_sound(
+                load_or_generate('countdown', lambda: self.generate_tone(800, 0.15, 'sine', decay=False))
             )
-            self.sounds['countdown'] = countdown_sound
-            
+
             print("[OK] 所有音效创建成功")
             
         except ImportError:
@@ -192,99 +381,87 @@ class SoundManager:
             self.sounds = {key: None for key in ['jump', 'score', 'crash', 'powerup', 'menu_select', 'menu_confirm', 'background']}
     
     def generate_tone(self, frequency, duration, wave_type='sine', decay=True, vibrato=False):
-        """生成改进的音调"""
+        """生成改进的音调 - 使用numpy向量化计算，避免逐样本Python循环"""
         import numpy as np
-        
+
         sample_rate = 22050
         frames = int(duration * sample_rate)
-        
-        # 使用numpy创建数组
-        arr = np.zeros((frames, 2), dtype=np.int16)
-        
-        for i in range(frames):
-            time = float(i) / sample_rate
-            
-            # 颤音效果
+
+        # 整个波形一次性用numpy数组运算生成
+        t = np.arange(frames, dtype=np.float32) / sample_rate
+
+        # 颤音效果
+        if vibrato:
+            freq_mod = frequency * (1 + 0.1 * np.sin(t * 20))
+        else:
             freq_mod = frequency
-            if vibrato:
-                freq_mod = frequency * (1 + 0.1 * math.sin(time * 20))
-            
-            if wave_type == 'sine':
-                wave = math.sin(freq_mod * 2 * math.pi * time)
-            elif wave_type == 'sawtooth':
-                wave = 2 * (time * freq_mod - math.floor(time * freq_mod + 0.5))
-            else:
-                wave = math.sin(freq_mod * 2 * math.pi * time)
-            
-            # 添加衰减效果
-            if decay:
-                envelope = 1.0 - (i / frames)
-                wave *= envelope
-            
-            # 转换为16位整数
-            sample = int(wave * 32767)
-            arr[i] = [sample, sample]
-        
-        return arr
+
+        if wave_type == 'sawtooth':
+            ft = t * freq_mod
+            wave = 2 * (ft - np.floor(ft + 0.5))
+        else:  # 默认正弦波
+            wave = np.sin(freq_mod * 2 * np.pi * t)
+
+        # 添加衰减效果
+        if decay:
+            wave *= 1.0 - np.arange(frames) / frames
+
+        # 转换为16位整数（双声道）
+        # 一次clip+cast，防止求和/颤音越界时int16回绕
+        samples = np.clip(wave * 32767, -32768, 32767).astype(np.int16)
+        return np.stack([samples, samples], axis=1)
     
     def generate_chord(self, frequencies, duration, wave_type='sine', vibrato=False):
-        """生成和弦音效"""
+        """生成和弦音效 - 利用numpy广播一次性叠加所有频率"""
         import numpy as np
-        
+
         sample_rate = 22050
         frames = int(duration * sample_rate)
-        arr = np.zeros((frames, 2), dtype=np.int16)
-        
-        for i in range(frames):
-            time = float(i) / sample_rate
-            wave = 0
-            
-            for freq in frequencies:
-                if wave_type == 'sine':
-                    wave += math.sin(freq * 2 * math.pi * time) / len(frequencies)
-                elif wave_type == 'sawtooth':
-                    wave += (2 * (time * freq - math.floor(time * freq + 0.5))) / len(frequencies)
-            
-            # 添加衰减效果
-            envelope = 1.0 - (i / frames)
-            wave *= envelope
-            
-            sample = int(wave * 32767)
-            arr[i] = [sample, sample]
-        
-        return arr
+
+        # 频率×时间的二维广播，一次ufunc调用生成全部分量
+        t = np.arange(frames) / sample_rate
+        f = np.asarray(frequencies, dtype=np.float64)[:, None]
+
+        if wave_type == 'sawtooth':
+            ft = f * t[None, :]
+            waves = 2 * (ft - np.floor(ft + 0.5))
+        else:  # 默认正弦波
+            waves = np.sin(2 * np.pi * f * t[None, :])
+
+        # 各频率取平均后叠加衰减包络
+        wave = waves.mean(axis=0)
+        wave *= 1.0 - np.arange(frames) / frames
+
+        # 一次clip+cast，防止求和/颤音越界时int16回绕
+        samples = np.clip(wave * 32767, -32768, 32767).astype(np.int16)
+        return np.stack([samples, samples], axis=1)
     
     def generate_melody(self, frequencies, duration, wave_type='sine'):
-        """生成旋律音效"""
+        """生成旋律音效 - 用向量化的索引查表选择音符，再整体计算波形"""
         import numpy as np
-        
+
         sample_rate = 22050
         frames = int(duration * sample_rate)
-        arr = np.zeros((frames, 2), dtype=np.int16)
         note_duration = duration / len(frequencies)
-        
-        for i in range(frames):
-            time = float(i) / sample_rate
-            note_index = int(time / note_duration)
-            
-            if note_index >= len(frequencies):
-                note_index = len(frequencies) - 1
-            
-            freq = frequencies[note_index]
-            
-            if wave_type == 'sine':
-                wave = math.sin(freq * 2 * math.pi * time)
-            elif wave_type == 'sawtooth':
-                wave = 2 * (time * freq - math.floor(time * freq + 0.5))
-            
-            # 添加衰减效果
-            envelope = 1.0 - (i / frames)
-            wave *= envelope
-            
-            sample = int(wave * 32767)
-            arr[i] = [sample, sample]
-        
-        return arr
+
+        # 每个样本所属的音符索引，一次性向量化计算
+        freqs = np.asarray(frequencies, dtype=np.float64)
+        t = np.arange(frames) / sample_rate
+        idx = np.clip((t / note_duration).astype(np.int64), 0, len(freqs) - 1)
+        f = freqs[idx]
+
+        if wave_type == 'sawtooth':
+            ft = t * f
+            wave = 2 * (ft - np.floor(ft + 0.5))
+        else:  # 默认正弦波
+            wave = np.sin(f * 2 * np.pi * t)
+
+        # 添加衰减效果
+        wave *= 1.0 - np.arange(frames) / frames
+
+        # 一次clip+cast，防止求和/颤音越界时int16回绕
+        samples = np.clip(wave * 32767, -32768, 32767).astype(np.int16)
+        return np.stack([samples, samples], axis=1)
     
     def generate_background_music(self):
         """生成背景音乐 - 轻快愉悦的旋律"""
@@ -293,8 +470,7 @@ class SoundManager:
         sample_rate = 22050
         duration = 16.0  # 16秒循环
         frames = int(duration * sample_rate)
-        arr = np.zeros((frames, 2), dtype=np.int16)
-        
+
         # 更柔和愉悦的旋律 - C大调五声音阶（去掉半音，更和谐）
         # 五声音阶：C D E G A (523, 587, 659, 784, 880)
         melody = [
@@ -311,41 +487,43 @@ class SoundManager:
         
         # 每个音符的时长（秒）
         note_duration = duration / len(melody)
-        
-        for i in range(frames):
-            time = float(i) / sample_rate
-            # 计算当前应该播放哪个音符
-            note_index = int(time / note_duration) % len(melody)
-            freq = melody[note_index]
-            
-            # 计算音符内的相对时间（用于包络）
-            note_time = (time % note_duration) / note_duration
-            
-            # 柔和的ADSR包络
-            if note_time < 0.15:  # Attack - 更柔和的起音
-                envelope = (note_time / 0.15) * 0.7
-            elif note_time < 0.75:  # Sustain - 保持
-                envelope = 0.7
-            else:  # Release - 渐弱
-                envelope = 0.7 * (1 - (note_time - 0.75) / 0.25)
-            
-            # 主旋律 - 使用纯净的正弦波，音量降低
-            wave = math.sin(freq * 2 * math.pi * time) * envelope * 0.08
-            
-            # 添加柔和的三度和声
-            wave += math.sin(freq * 1.25 * 2 * math.pi * time) * envelope * 0.04
-            
-            # 添加低音衬托（降低音量）
-            wave += math.sin(freq * 0.5 * 2 * math.pi * time) * envelope * 0.03
-            
-            # 添加一点点颤音效果让声音更生动
-            vibrato = 1 + 0.015 * math.sin(5 * 2 * math.pi * time)
-            wave *= vibrato
-            
-            sample = int(wave * 32767)
-            arr[i] = [sample, sample]
-        
-        return arr
+
+        melody_arr = np.asarray(melody, dtype=np.float64)
+
+        # 安装了numba时走JIT内核：一次遍历完成合成，没有中间临时数组
+        if _numba is not None:
+            arr = np.empty((frames, 2), dtype=np.int16)
+            _synth_bg_core(arr, melody_arr, note_duration, sample_rate, frames)
+            return arr
+
+        # 整段音乐用numpy向量化一次性生成（约35万个样本，Python循环会卡顿数秒）
+        t = np.arange(frames) / sample_rate
+        # 计算每个样本应该播放哪个音符
+        idx = (t / note_duration).astype(np.int64) % len(melody_arr)
+        freq = melody_arr[idx]
+
+        # 计算音符内的相对时间（用于包络）
+        note_time = (t % note_duration) / note_duration
+
+        # 柔和的ADSR包络：Attack（起音）/ Sustain（保持）/ Release（渐弱）
+        envelope = np.select(
+            [note_time < 0.15, note_time < 0.75],
+            [(note_time / 0.15) * 0.7, 0.7],
+            default=0.7 * (1 - (note_time - 0.75) / 0.25)
+        )
+
+        # 主旋律 + 柔和的三度和声 + 低音衬托
+        wave = (np.sin(freq * 2 * np.pi * t) * 0.08
+                + np.sin(freq * 1.25 * 2 * np.pi * t) * 0.04
+                + np.sin(freq * 0.5 * 2 * np.pi * t) * 0.03) * envelope
+
+        # 添加一点点颤音效果让声音更生动
+        wave *= 1 + 0.015 * np.sin(5 * 2 * np.pi * t)
+
+        # 双声道：两列指向同一份mono数据，复制成连续数组交给sndarray
+        # 一次clip+cast，防止求和/颤音越界时int16回绕
+        samples = np.clip(wave * 32767, -32768, 32767).astype(np.int16)
+        return np.ascontiguousarray(np.broadcast_to(samples[:, None], (frames, 2)))
     
     def play_sound(self, sound_name):
         """播放音效"""
@@ -407,63 +585,112 @@ class SoundManager:
             except:
                 pass
 
-class Particle:
-    def __init__(self, x, y, color, velocity_x=0, velocity_y=0, life=30):
-        self.x = x
-        self.y = y
-        self.color = color
-        self.velocity_x = velocity_x
-        self.velocity_y = velocity_y
-        self.life = life
-        self.max_life = life
-        self.size = random.randint(2, 5)
-    
-    def update(self):
-        self.x += self.velocity_x
-        self.y += self.velocity_y
-        self.velocity_y += 0.2  # 重力
-        self.life -= 1
-        
-        # 添加一些随机性
-        self.velocity_x += random.uniform(-0.5, 0.5)
-    
-    def draw(self, screen):
-        if self.life > 0:
-            alpha = int(255 * (self.life / self.max_life))
-            size = int(self.size * (self.life / self.max_life))
-            if size > 0:
-                pygame.draw.circle(screen, self.color, (int(self.x), int(self.y)), size)
-
 class ParticleSystem:
+    """粒子系统 - 按字段存储numpy数组（SoA），位置/速度/寿命整批向量化更新"""
+
     def __init__(self):
-        self.particles = []
-    
+        import numpy as np
+        self._np = np
+        self.x = np.empty(0, dtype=np.float32)
+        self.y = np.empty(0, dtype=np.float32)
+        self.vx = np.empty(0, dtype=np.float32)
+        self.vy = np.empty(0, dtype=np.float32)
+        self.life = np.empty(0, dtype=np.float32)
+        self.max_life = np.empty(0, dtype=np.float32)
+        self.size = np.empty(0, dtype=np.float32)
+        self.colors = np.empty((0, 3), dtype=np.uint8)
+
+    def clear(self):
+        """清空所有粒子"""
+        self._compact(self.life < 0)
+
+    def _append(self, x, y, vx, vy, life, color):
+        """批量追加一组粒子（vx/vy为numpy数组）"""
+        np = self._np
+        n = len(vx)
+        self.x = np.concatenate([self.x, np.full(n, x, dtype=np.float32)])
+        self.y = np.concatenate([self.y, np.full(n, y, dtype=np.float32)])
+        self.vx = np.concatenate([self.vx, vx.astype(np.float32)])
+        self.vy = np.concatenate([self.vy, vy.astype(np.float32)])
+        self.life = np.concatenate([self.life, np.full(n, life, dtype=np.float32)])
+        self.max_life = np.concatenate([self.max_life, np.full(n, life, dtype=np.float32)])
+        self.size = np.concatenate([self.size, np.random.randint(2, 6, n).astype(np.float32)])
+        self.colors = np.concatenate([self.colors, np.tile(np.asarray(color, dtype=np.uint8), (n, 1))])
+
+    def _compact(self, alive):
+        """按存活掩码压缩所有字段数组"""
+        self.x = self.x[alive]
+        self.y = self.y[alive]
+        self.vx = self.vx[alive]
+        self.vy = self.vy[alive]
+        self.life = self.life[alive]
+        self.max_life = self.max_life[alive]
+        self.size = self.size[alive]
+        self.colors = self.colors[alive]
+
     def add_explosion(self, x, y, color=YELLOW, count=10):
         """添加爆炸粒子效果"""
-        for _ in range(count):
-            angle = random.uniform(0, 2 * math.pi)
-            speed = random.uniform(2, 6)
-            velocity_x = math.cos(angle) * speed
-            velocity_y = math.sin(angle) * speed
-            particle = Particle(x, y, color, velocity_x, velocity_y)
-            self.particles.append(particle)
-    
+        np = self._np
+        angles = np.random.uniform(0, 2 * np.pi, count)
+        speeds = np.random.uniform(2, 6, count)
+        self._append(x, y, np.cos(angles) * speeds, np.sin(angles) * speeds,
+                     life=30, color=color)
+
     def add_trail(self, x, y, color=WHITE, count=3):
         """添加轨迹粒子效果"""
-        for _ in range(count):
-            velocity_x = random.uniform(-1, 1)
-            velocity_y = random.uniform(-2, 2)
-            particle = Particle(x, y, color, velocity_x, velocity_y, life=15)
-            self.particles.append(particle)
-    
+        np = self._np
+        self._append(x, y, np.random.uniform(-1, 1, count), np.random.uniform(-2, 2, count),
+                     life=15, color=color)
+
     def update(self):
-        self.particles = [p for p in self.particles if p.life > 0]
-        for particle in self.particles:
-            particle.update()
-    
+        np = self._np
+        # 移除已死亡的粒子
+        alive = self.life > 0
+        if not alive.all():
+            self._compact(alive)
+        if self.x.size == 0:
+            return
+        # 随机扰动批量生成一次
+        noise = np.random.uniform(-0.5, 0.5, self.x.size).astype(np.float32)
+        if _numba is not None:
+            # numba内核单次遍历融合全部更新，省去numpy路径的中间数组
+            _update_particles_core(self.x, self.y, self.vx, self.vy, self.life, noise)
+            return
+        # 整批更新：位置、重力、寿命、速度随机扰动
+        self.x += self.vx
+        self.y += self.vy
+        self.vy += 0.2  # 重力
+        self.life -= 1
+        self.vx += noise
+
+    # 预渲染的圆形粒子精灵缓存，key为(r, g, b, 半径)，全实例共享
+    _sprites = {}
+
     def draw(self, screen):
-        for particle in self.particles:
-            particle.draw(screen)
+        np = self._np
+        # 大小随剩余寿命衰减（整批计算）
+        frac = self.life / self.max_life
+        sizes = (self.size * frac).astype(np.int32)
+        drawable = np.nonzero((self.life > 0) & (sizes > 0))[0]
+        if drawable.size == 0:
+            return
+
+        # 按(颜色, 大小)分桶，同桶粒子复用一个预渲染精灵并用fblits一次性批量blit
+        buckets = {}
+        for i in drawable:
+            size = int(sizes[i])
+            key = (int(self.colors[i, 0]), int(self.colors[i, 1]), int(self.colors[i, 2]), size)
+            buckets.setdefault(key, []).append((int(self.x[i]) - size, int(self.y[i]) - size))
+
+        for key, positions in buckets.items():
+            sprite = self._sprites.get(key)
+            if sprite is None:
+                r, g, b, size = key
+                sprite = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
+                pygame.draw.circle(sprite, (r, g, b), (size, size), size)
+                sprite = sprite.convert_alpha()
+                self._sprites[key] = sprite
+            batch_blit(screen, [(sprite, pos) for pos in positions])
 
 class Bird:
     def __init__(self, x, y, difficulty="中等", bird_image=None):
@@ -473,10 +700,8 @@ class Bird:
         self.height = 30
         self.velocity = 0
         
-        # 根据难度调整参数
-        settings = DIFFICULTY_SETTINGS[difficulty]
-        self.gravity = settings["gravity"]
-        self.jump_strength = settings["jump_strength"]
+        # 根据难度调整参数（扁平化配置，见_BIRD_CFG）
+        self.gravity, self.jump_strength = _BIRD_CFG[difficulty]
         
         self.rotation = 0
         self.max_rotation = 25
@@ -486,7 +711,19 @@ class Bird:
         # 使用缓存的小鸟图片（如果提供）
         self.bird_image = bird_image
         self.use_custom_image = self.bird_image is not None
-        
+
+        # 自定义图片的预旋转缓存：rotation被限制在±max_rotation内，
+        # 按1°离散预生成全部角度，每帧查表blit，避免逐帧旋转alpha图片
+        if self.use_custom_image:
+            self._rot_cache = [pygame.transform.rotate(self.bird_image, angle)
+                               for angle in range(-self.max_rotation, self.max_rotation + 1)]
+
+        # 程序绘制路径的精灵缓存：外观只取决于翅膀相位/旋转角度/飞行方向，
+        # 离散化后预渲染，每帧从缓存取Surface直接blit，避免重复绘制图元和旋转
+        self._sprite_cache = {}
+        self._wing_buckets = 8    # 翅膀相位离散档数
+        self._rot_buckets = 16    # 旋转角度离散档数
+
     def jump(self):
         """小鸟跳跃"""
         self.velocity = self.jump_strength
@@ -501,29 +738,54 @@ class Bird:
         self.wing_animation += self.wing_speed
         
         # 根据速度调整旋转角度
+        # 量化到整数度：1°以内肉眼不可辨，且让旋转缓存可以直接按度查表
         if self.velocity < 0:  # 向上飞
-            self.rotation = min(self.max_rotation, -self.velocity * 2)
+            self.rotation = int(round(min(self.max_rotation, -self.velocity * 2)))
         else:  # 向下落
-            self.rotation = max(-self.max_rotation, -self.velocity * 2)
+            self.rotation = int(round(max(-self.max_rotation, -self.velocity * 2)))
             
     def draw(self, screen):
         """绘制更生动的小鸟"""
         center_x = self.x + self.width//2
         center_y = self.y + self.height//2
-        
-        # 如果有自定义图片，使用图片
+
+        # 如果有自定义图片，从预旋转缓存中取对应角度的图片
+        # （rotation在update中已量化为整数度，直接作为缓存下标）
         if self.use_custom_image:
-            # 旋转图片
-            rotated_bird = pygame.transform.rotate(self.bird_image, self.rotation)
+            angle = max(-self.max_rotation, min(self.max_rotation, self.rotation))
+            rotated_bird = self._rot_cache[angle + self.max_rotation]
             rotated_rect = rotated_bird.get_rect(center=(center_x, center_y))
             screen.blit(rotated_bird, rotated_rect)
             return
-        
-        # 否则使用程序绘制
+
+        # 否则使用程序绘制：离散化动画状态后查缓存，每帧只做一次blit
+        wing_bucket = int(((self.wing_animation * 1.5) % (2 * math.pi))
+                          / (2 * math.pi / self._wing_buckets)) % self._wing_buckets
+        rot_span = 2 * self.max_rotation
+        rot_bucket = int((self.rotation + self.max_rotation) / rot_span * self._rot_buckets)
+        rot_bucket = max(0, min(self._rot_buckets - 1, rot_bucket))
+        going_up = self.velocity < 0
+
+        key = (wing_bucket, rot_bucket, going_up)
+        rotated_bird = self._sprite_cache.get(key)
+        if rotated_bird is None:
+            rotated_bird = self._sprite_cache[key] = self._render_frame(wing_bucket, rot_bucket, going_up)
+        rotated_rect = rotated_bird.get_rect(center=(center_x, center_y))
+        screen.blit(rotated_bird, rotated_rect)
+
+    def _render_frame(self, wing_bucket, rot_bucket, going_up):
+        """渲染一帧离散化的小鸟精灵（只在缓存未命中时调用）"""
+        wing_phase = math.sin(wing_bucket * (2 * math.pi / self._wing_buckets))
+        rotation = -self.max_rotation + (rot_bucket + 0.5) * (2 * self.max_rotation / self._rot_buckets)
+        bird_surface = self._render_body(wing_phase, going_up)
+        return pygame.transform.rotate(bird_surface, rotation).convert_alpha()
+
+    def _render_body(self, wing_phase, going_up):
+        """程序绘制未旋转的小鸟身体"""
         # 创建一个临时surface用于旋转
         bird_surface = pygame.Surface((self.width * 2, self.height * 2), pygame.SRCALPHA)
         temp_center = self.width
-        
+
         # 绘制小鸟身体（圆形）
         # 外层阴影
         pygame.draw.circle(bird_surface, (200, 200, 0), (temp_center, temp_center), self.width//2 + 2)
@@ -534,7 +796,6 @@ class Bird:
         
         # 绘制翅膀动画（更生动的扇动效果）
         # 增强动画幅度，让翅膀扇动更明显
-        wing_phase = math.sin(self.wing_animation * 1.5)  # 加快翅膀扇动频率
         wing_offset = int(wing_phase * 15)  # 增加翅膀上下摆动的幅度
         wing_scale = 1 + abs(wing_phase) * 0.8  # 翅膀张开更大，更明显
         
@@ -580,19 +841,19 @@ class Bird:
         # 眼白
         pygame.draw.circle(bird_surface, WHITE, (temp_center + 6, temp_center - 6), eye_radius)
         # 瞳孔（根据速度方向略微移动）
-        pupil_offset_y = -1 if self.velocity < 0 else 1
+        pupil_offset_y = -1 if going_up else 1
         pygame.draw.circle(bird_surface, BLACK, (temp_center + 7, temp_center - 5 + pupil_offset_y), 2)
         # 高光
         pygame.draw.circle(bird_surface, WHITE, (temp_center + 7.5, temp_center - 6 + pupil_offset_y), 1)
         
         # 绘制腮红（浅粉色，更自然的颜色）
-        blush_color = (255, 200, 200, 100)  # 浅粉色，半透明
+        # 直接画到身体Surface上：颜色取半透明粉(alpha=100)与身体黄混合后的结果，
+        # 省去每次渲染都新建临时SRCALPHA小Surface再alpha混合的开销
+        blush_color = (255, 212, 78)
         # 左脸颊
-        blush_surface = pygame.Surface((8, 6), pygame.SRCALPHA)
-        pygame.draw.ellipse(blush_surface, blush_color, (0, 0, 8, 6))
-        bird_surface.blit(blush_surface, (temp_center - 12, temp_center))
+        pygame.draw.ellipse(bird_surface, blush_color, (temp_center - 12, temp_center, 8, 6))
         # 右脸颊
-        bird_surface.blit(blush_surface, (temp_center - 6, temp_center))
+        pygame.draw.ellipse(bird_surface, blush_color, (temp_center - 6, temp_center, 8, 6))
         
         # 绘制小鸟嘴巴（更立体，稍微小一点）
         beak_points = [
@@ -610,72 +871,89 @@ class Bird:
         eyebrow_start = (temp_center + 2, temp_center - 9)
         eyebrow_end = (temp_center + 9, temp_center - 8)
         pygame.draw.line(bird_surface, (50, 50, 50), eyebrow_start, eyebrow_end, 2)
-        
-        # 旋转整个小鸟
-        rotated_bird = pygame.transform.rotate(bird_surface, self.rotation)
-        rotated_rect = rotated_bird.get_rect(center=(center_x, center_y))
-        screen.blit(rotated_bird, rotated_rect)
-        
+
+        return bird_surface
+
     def get_rect(self):
         """获取小鸟的碰撞矩形"""
         return pygame.Rect(self.x, self.y, self.width, self.height)
 
 class Pipe:
+    # 管道渐变列（宽60×高1），全类共享，首次使用时生成
+    # 之后每帧只需按管道高度缩放blit一次，替代逐列draw.line
+    _gradient_strip = None
+
+    # 组合管道模板缓存：渐变主体+边框+装饰一次烘焙进同一Surface，
+    # 按_BUCKET像素高度档缓存；blit时锚定在缺口边缘，多余部分超出屏幕
+    _top_cache = {}
+    _bot_cache = {}
+    _BUCKET = 8
+
+    @classmethod
+    def _get_gradient_strip(cls):
+        if cls._gradient_strip is None:
+            strip = pygame.Surface((60, 1))
+            for i in range(60):
+                strip.set_at((i, 0), (0, int(200 - i * 0.5), 0))
+            cls._gradient_strip = strip.convert()
+        return cls._gradient_strip
+
+    def _get_top_template(self, height):
+        """获取上管道组合模板（高度向上取整到档位）"""
+        bucket = -(-height // self._BUCKET) * self._BUCKET
+        surf = Pipe._top_cache.get(bucket)
+        if surf is None:
+            surf = pygame.Surface((self.width + 10, bucket), pygame.SRCALPHA)
+            surf.blit(pygame.transform.scale(self._get_gradient_strip(), (self.width, bucket)), (5, 0))
+            pygame.draw.rect(surf, DARK_GREEN, (5, 0, self.width, bucket), 3)
+            # 管道口装饰（位于缺口一侧，即模板底部）
+            pygame.draw.rect(surf, DARK_GREEN, (0, bucket - 20, self.width + 10, 20))
+            surf = Pipe._top_cache[bucket] = surf.convert_alpha()
+        return surf, bucket
+
+    def _get_bot_template(self, height):
+        """获取下管道组合模板（高度向上取整到档位）"""
+        bucket = -(-height // self._BUCKET) * self._BUCKET
+        surf = Pipe._bot_cache.get(bucket)
+        if surf is None:
+            surf = pygame.Surface((self.width + 10, bucket), pygame.SRCALPHA)
+            surf.blit(pygame.transform.scale(self._get_gradient_strip(), (self.width, bucket)), (5, 0))
+            pygame.draw.rect(surf, DARK_GREEN, (5, 0, self.width, bucket), 3)
+            # 管道口装饰（位于缺口一侧，即模板顶部）
+            pygame.draw.rect(surf, DARK_GREEN, (0, 0, self.width + 10, 20))
+            surf = Pipe._bot_cache[bucket] = surf.convert_alpha()
+        return surf, bucket
+
     def __init__(self, x, difficulty="中等"):
         self.x = x
         self.width = 60
         
-        # 根据难度调整参数
-        settings = DIFFICULTY_SETTINGS[difficulty]
-        self.gap = settings["pipe_gap"]
-        self.speed = settings["pipe_speed"]
+        # 根据难度调整参数（扁平化配置，见_PIPE_CFG）
+        self.speed, self.gap = _PIPE_CFG[difficulty]
         
         # 随机生成管道高度
         self.top_height = random.randint(50, SCREEN_HEIGHT - self.gap - 50)
         self.bottom_y = self.top_height + self.gap
+
+        # 是否已计过分（普通属性读取远快于hasattr的异常探测）
+        self.scored = False
         
     def update(self):
         """更新管道位置"""
         self.x -= self.speed
         
+    def blit_pairs(self):
+        """返回上下管道的(Surface, 位置)对，供Game层统一批量blit。
+        模板锚定在缺口边缘保证缺口位置像素级精确，多余部分被屏幕裁掉"""
+        top_surf, top_bucket = self._get_top_template(self.top_height)
+        bot_surf, _ = self._get_bot_template(SCREEN_HEIGHT - self.bottom_y)
+        return ((top_surf, (self.x - 5, self.top_height - top_bucket)),
+                (bot_surf, (self.x - 5, self.bottom_y)))
+
     def draw(self, screen):
         """绘制美化的管道"""
-        # 绘制上管道 - 添加渐变和阴影效果
-        top_pipe = pygame.Rect(self.x, 0, self.width, self.top_height)
-        
-        # 管道主体渐变
-        for i in range(self.width):
-            alpha = int(255 * (1 - i / self.width * 0.3))
-            color = (0, int(200 - i * 0.5), 0)
-            pygame.draw.line(screen, color, 
-                           (self.x + i, 0), (self.x + i, self.top_height))
-        
-        # 管道边框
-        pygame.draw.rect(screen, DARK_GREEN, top_pipe, 3)
-        
-        # 管道顶部装饰
-        pygame.draw.rect(screen, DARK_GREEN, 
-                        (self.x - 5, self.top_height - 20, self.width + 10, 20))
-        
-        # 绘制下管道
-        bottom_pipe = pygame.Rect(self.x, self.bottom_y, self.width, 
-                                 SCREEN_HEIGHT - self.bottom_y)
-        
-        # 管道主体渐变
-        for i in range(self.width):
-            alpha = int(255 * (1 - i / self.width * 0.3))
-            color = (0, int(200 - i * 0.5), 0)
-            pygame.draw.line(screen, color, 
-                           (self.x + i, self.bottom_y), 
-                           (self.x + i, SCREEN_HEIGHT))
-        
-        # 管道边框
-        pygame.draw.rect(screen, DARK_GREEN, bottom_pipe, 3)
-        
-        # 管道底部装饰
-        pygame.draw.rect(screen, DARK_GREEN, 
-                        (self.x - 5, self.bottom_y, self.width + 10, 20))
-        
+        batch_blit(screen, self.blit_pairs())
+
     def get_rects(self):
         """获取管道的碰撞矩形"""
         top_rect = pygame.Rect(self.x, 0, self.width, self.top_height)
@@ -700,37 +978,143 @@ class Background:
         # 背景滚动相关
         self.bg_scroll_x = 0  # 背景滚动位置
         self.bg_scroll_speed = 0.5  # 背景滚动速度（慢速，营造远景感）
+
+        # 预先烘焙天空渐变LUT：呼吸亮度sin(t)*5取整后只有11个档位，
+        # 逐档一次性生成整屏渐变Surface，每帧按当前亮度档blit
+        self._sky_variants = []
+        try:
+            import numpy as np
+        except ImportError:
+            np = None
+
+        if np is not None and _numba is not None:
+            # 安装了numba时用并行内核一次性填完所有亮度档的像素
+            pixels = np.empty((11, SCREEN_WIDTH, SCREEN_HEIGHT, 3), dtype=np.uint8)
+            _build_sky_pixels(pixels, SCREEN_WIDTH, SCREEN_HEIGHT)
+            for k in range(11):
+                surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+                pygame.surfarray.blit_array(surface, pixels[k])
+                self._sky_variants.append(surface)
+        elif np is not None:
+            ratio = np.arange(SCREEN_HEIGHT)[:, None] / SCREEN_HEIGHT
+            for brightness in range(-5, 6):
+                r = np.clip(160 + (200 - 160) * ratio + brightness, 0, 255)
+                g = np.clip(220 + (235 - 220) * ratio + brightness, 0, 255)
+                b = np.clip(np.full_like(ratio, 255.0) + brightness, 0, 255)
+                rgb = np.concatenate([r, g, b], axis=1).astype(np.uint8)  # (H, 3)
+                # 广播到pygame的(W, H, 3)布局后整块写入Surface
+                pixels = np.ascontiguousarray(
+                    np.broadcast_to(rgb[None, :, :], (SCREEN_WIDTH, SCREEN_HEIGHT, 3)))
+                surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+                pygame.surfarray.blit_array(surface, pixels)
+                self._sky_variants.append(surface)
+        else:
+            # numpy未安装时用逐像素列+缩放的慢速路径（只在初始化时跑一次）
+            for brightness in range(-5, 6):
+                column = pygame.Surface((1, SCREEN_HEIGHT))
+                for y in range(SCREEN_HEIGHT):
+                    ratio = y / SCREEN_HEIGHT
+                    r = max(0, min(255, int(160 + (200 - 160) * ratio + brightness)))
+                    g = max(0, min(255, int(220 + (235 - 220) * ratio + brightness)))
+                    b = max(0, min(255, 255 + brightness))
+                    column.set_at((0, y), (r, g, b))
+                self._sky_variants.append(
+                    pygame.transform.scale(column, (SCREEN_WIDTH, SCREEN_HEIGHT)))
         
         # 动态元素
         self.sun_y = 100  # 太阳的Y位置
         self.sun_direction = 0.1  # 太阳移动方向
-        
-        # 远景飞鸟
-        self.distant_birds = []
+
+        # 太阳光晕：半径和透明度固定，预渲染三层并转显示格式，
+        # 每帧只剩查表blit（太阳只在竖直方向缓慢移动）
+        self._sun_glows = []
         for i in range(3):
-            self.distant_birds.append({
-                'x': random.randint(0, SCREEN_WIDTH),
-                'y': random.randint(80, 200),
-                'speed': random.uniform(0.3, 0.8),
-                'wing_phase': random.uniform(0, 6.28)
-            })
-        
-        self.clouds = []
-        self.cloud_speed = 1
+            glow_radius = 30 + (i + 1) * 10
+            glow_alpha = 30 - i * 8
+            glow_surface = pygame.Surface((glow_radius * 2, glow_radius * 2), pygame.SRCALPHA)
+            pygame.draw.circle(glow_surface, (255, 255, 150, glow_alpha),
+                               (glow_radius, glow_radius), glow_radius)
+            self._sun_glows.append((glow_surface.convert_alpha(), glow_radius))
         
-        # 生成初始云朵（速度更慢）
-        for i in range(5):
-            cloud = {
-                'x': random.randint(0, SCREEN_WIDTH),
-                'y': random.randint(50, SCREEN_HEIGHT // 2),
-                'size': random.randint(25, 45),
-                'speed': random.uniform(0.2, 0.6),  # 初始速度更慢
-                'puffiness': random.uniform(0.8, 1.2),  # 云朵蓬松度
-                'wobble': random.uniform(0, 6.28),  # 云朵摆动相位
-                'alpha': random.randint(220, 245)  # 云朵透明度
-            }
-            self.clouds.append(cloud)
+        # 云朵/远景飞鸟的预渲染精灵缓存（按外观参数取用，见draw的批量blit）
+        self._cloud_sprites = {}
+        self._bird_sprites = {}
+
+        # 远景飞鸟：SoA数组存储（位置/速度/翅膀相位），每帧整体向量更新
+        n_birds = 3
+        self._bird_x = np.array([random.randint(0, SCREEN_WIDTH) for _ in range(n_birds)], dtype=np.float64)
+        self._bird_y = np.array([random.randint(80, 200) for _ in range(n_birds)], dtype=np.float64)
+        self._bird_speed = np.array([random.uniform(0.3, 0.8) for _ in range(n_birds)])
+        self._bird_phase = np.array([random.uniform(0, 6.28) for _ in range(n_birds)])
+
+        self.cloud_speed = 1
+
+        # 云朵：运动量（位置/速度/摆动相位）用SoA数组整体更新；
+        # 外观参数（大小/蓬松度/透明度）只在回收时变化（初始速度更慢）
+        n_clouds = 5
+        self._cloud_x = np.array([random.randint(0, SCREEN_WIDTH) for _ in range(n_clouds)], dtype=np.float64)
+        self._cloud_y = np.array([random.randint(50, SCREEN_HEIGHT // 2) for _ in range(n_clouds)], dtype=np.float64)
+        self._cloud_size = np.array([random.randint(25, 45) for _ in range(n_clouds)], dtype=np.int64)
+        self._cloud_vx = np.array([random.uniform(0.2, 0.6) for _ in range(n_clouds)])
+        self._cloud_puff = [random.uniform(0.8, 1.2) for _ in range(n_clouds)]
+        self._cloud_wobble = np.array([random.uniform(0, 6.28) for _ in range(n_clouds)])
+        self._cloud_alpha = [random.randint(220, 245) for _ in range(n_clouds)]
+        # 每朵云直接持有自己的预渲染Surface，只在回收换外观时重新取，
+        # 绘制路径完全没有Surface分配和缓存查找
+        self._cloud_surfs = [
+            self._get_cloud_sprite(int(self._cloud_size[i]),
+                                   self._cloud_puff[i], self._cloud_alpha[i])
+            for i in range(n_clouds)
+        ]
         
+        # 预先烘焙草地渐变（静态内容，原先每帧用draw.line逐行重画）
+        grass_height = 80
+        self._grass_gradient = pygame.Surface((SCREEN_WIDTH, grass_height))
+        if np is not None:
+            # numpy广播一次算出整块(W, H, 3)像素后整体写入Surface
+            ratio = np.arange(grass_height) / grass_height
+            r = (140 + (80 - 140) * ratio).astype(np.uint8)
+            g = (220 + (180 - 220) * ratio).astype(np.uint8)
+            b = (140 + (80 - 140) * ratio).astype(np.uint8)
+            rgb = np.stack([r, g, b], axis=-1)  # (H, 3)
+            pixels = np.ascontiguousarray(
+                np.broadcast_to(rgb[None, :, :], (SCREEN_WIDTH, grass_height, 3)))
+            pygame.surfarray.blit_array(self._grass_gradient, pixels)
+        else:
+            for y in range(grass_height):
+                # 从浅绿到较深的绿的渐变（更明亮）
+                ratio = y / grass_height
+                r = int(140 + (80 - 140) * ratio)
+                g = int(220 + (180 - 220) * ratio)
+                b = int(140 + (80 - 140) * ratio)
+                pygame.draw.line(self._grass_gradient, (r, g, b), (0, y), (SCREEN_WIDTH, y))
+
+        # 把草地渐变直接烘焙进每档天空Surface：两块静态图层合成一次，
+        # 每帧背景只剩一个整屏blit（草地区域不会被云/飞鸟等动态元素盖住）；
+        # 烘焙完转成显示像素格式，整屏blit免去逐帧格式转换
+        for k, sky in enumerate(self._sky_variants):
+            sky.blit(self._grass_gradient, (0, SCREEN_HEIGHT - grass_height))
+            self._sky_variants[k] = sky.convert()
+
+        # 花朵精灵：整株（花茎+花瓣+花心）烘焙成一张，按(颜色, 摆动偏移)
+        # 预渲染4×5=20张，每朵花每帧从画线+blit变成纯粹一次blit
+        self._flower_sprites = {}
+        for color_idx, flower_color in enumerate(FLOWER_COLORS):
+            for sway in range(-2, 3):
+                flower_y = SCREEN_HEIGHT - grass_height - 5 + sway
+                # 精灵从花朵顶端一直延伸到草地顶端，花心在局部(8, 8)
+                sprite_h = (SCREEN_HEIGHT - grass_height) - (flower_y - 8)
+                sprite = pygame.Surface((16, sprite_h), pygame.SRCALPHA)
+                # 花茎（压在花瓣下层）
+                pygame.draw.line(sprite, (50, 150, 50), (8, 8), (8, sprite_h), 2)
+                for angle in range(0, 360, 60):
+                    rad = math.radians(angle)
+                    petal_x = 8 + int(math.cos(rad) * 5)
+                    petal_y = 8 + int(math.sin(rad) * 5)
+                    pygame.draw.circle(sprite, flower_color, (petal_x, petal_y), 3)
+                pygame.draw.circle(sprite, (255, 200, 0), (8, 8), 3)
+                self._flower_sprites[(color_idx, sway)] = sprite.convert_alpha()
+
         # 草叶摇摆动画变量
         self.grass_wave = 0  # 草叶摇摆相位
         
@@ -757,7 +1141,94 @@ class Background:
                 'angle_offset': angle_offset  # 预生成角度偏移
             }
             self.grass_blades.append(blade)
-    
+
+        # 草叶数据按字段转为numpy数组（SoA），顶端位置可整批向量化计算
+        # （np在上方天空LUT处导入，numpy缺失时为None）
+        if np is not None:
+            self._blade_x = np.array([b['x'] for b in self.grass_blades], dtype=np.float64)
+            self._blade_height = np.array([b['height'] for b in self.grass_blades], dtype=np.float64)
+            self._blade_angle = np.array([b['angle'] for b in self.grass_blades], dtype=np.float64)
+
+        # 草叶摇摆LUT：一个摆动周期离散成16帧，预渲染成带透明通道的长条Surface，
+        # 每帧按相位取对应长条blit一次，替代逐根草叶的三角函数计算和draw.line
+        self._grass_strip_h = max(b['height'] for b in self.grass_blades) + 4
+        self._grass_strips = []
+        for k in range(16):
+            phase = k * 2 * math.pi / 16
+            wave_offset = math.sin(phase) * 0.3  # 极其轻微的摇摆，几乎静止
+            strip = pygame.Surface((SCREEN_WIDTH, self._grass_strip_h), pygame.SRCALPHA)
+            if np is not None:
+                # 整批计算所有草叶的顶端x（远处的草摇摆更明显）
+                if _numba is not None:
+                    # numba内核单次遍历融合计算，写入预分配输出
+                    tip_xs = np.empty(self._blade_x.size, dtype=np.float64)
+                    _grass_tips_core(self._blade_x, self._blade_angle, self._blade_height,
+                                     wave_offset, SCREEN_WIDTH, tip_xs)
+                else:
+                    local_wave = wave_offset * (0.7 + self._blade_x / SCREEN_WIDTH * 0.3)
+                    tip_xs = (self._blade_x + self._blade_angle * self._blade_height
+                              + local_wave * (1 + self._blade_height / 30))
+                for j, blade in enumerate(self.grass_blades):
+                    pygame.draw.line(strip, blade['color'],
+                                   (blade['x'], self._grass_strip_h),
+                                   (tip_xs[j], self._grass_strip_h - blade['height']), 2)
+            else:
+                for blade in self.grass_blades:
+                    # 根据草叶位置计算摇摆幅度（远处的草摇摆更明显）
+                    grass_x_pos = blade['x'] / SCREEN_WIDTH
+                    local_wave = wave_offset * (0.7 + grass_x_pos * 0.3)
+                    tip_x = blade['x'] + blade['angle'] * blade['height'] + local_wave * (1 + blade['height'] / 30)
+                    pygame.draw.line(strip, blade['color'],
+                                   (blade['x'], self._grass_strip_h),
+                                   (tip_x, self._grass_strip_h - blade['height']), 2)
+            self._grass_strips.append(strip.convert_alpha())
+
+    def _get_distant_bird_sprite(self, wing_offset):
+        """获取指定翅膀位置的远景飞鸟精灵（共7档，首次使用时渲染）"""
+        sprite = self._bird_sprites.get(wing_offset)
+        if sprite is None:
+            # 简单的V字形飞鸟
+            bird_color = (80, 80, 100, 150)  # 半透明的暗色
+            sprite = pygame.Surface((15, 8), pygame.SRCALPHA)
+            # 左翅膀
+            pygame.draw.line(sprite, bird_color, (7, 4), (2, 1 + wing_offset), 2)
+            # 右翅膀
+            pygame.draw.line(sprite, bird_color, (7, 4), (12, 1 + wing_offset), 2)
+            sprite = self._bird_sprites[wing_offset] = sprite.convert_alpha()
+        return sprite
+
+    def _get_cloud_sprite(self, size, puff, alpha):
+        """获取指定外观的云朵精灵（参数只在云朵回收时变化，命中率极高）"""
+        key = (size, round(puff, 2), alpha)
+        sprite = self._cloud_sprites.get(key)
+        if sprite is None:
+            # 创建一个透明的surface来绘制云朵
+            sprite = pygame.Surface((size * 3, size * 2), pygame.SRCALPHA)
+
+            # 云朵底部阴影（柔和的灰色）
+            shadow_color = (210, 210, 220, alpha - 50)
+            pygame.draw.ellipse(sprite, shadow_color,
+                              (size//4, int(size * 1.3), int(size * 2.5), size//3))
+
+            # 云朵主体 - 简化版本，减少圆形数量以提高性能
+            # 中央大圆
+            pygame.draw.circle(sprite, (255, 255, 255, alpha),
+                             (int(size * 1.2), size), int(size * puff))
+
+            # 左侧（减少细节）
+            pygame.draw.circle(sprite, (255, 255, 255, alpha),
+                             (int(size * 0.7), int(size * 1.1)), int(size * 0.7 * puff))
+
+            # 右侧（减少细节）
+            pygame.draw.circle(sprite, (255, 255, 255, alpha),
+                             (int(size * 1.8), int(size * 1.05)), int(size * 0.8 * puff))
+
+            # 顶部
+            pygame.draw.circle(sprite, (255, 255, 255, alpha),
+                             (int(size * 1.1), int(size * 0.7)), int(size * 0.6 * puff))
+            sprite = self._cloud_sprites[key] = sprite.convert_alpha()
+        return sprite
+
     def update(self):
         """更新背景"""
         # 更新背景滚动位置（用于自定义背景图片）
@@ -771,33 +1242,33 @@ class Background:
         if self.sun_y < 80 or self.sun_y > 120:
             self.sun_direction *= -1
         
-        # 更新远景飞鸟
-        for bird in self.distant_birds:
-            bird['x'] -= bird['speed']
-            bird['wing_phase'] += 0.15
-            if bird['x'] < -50:
-                bird['x'] = SCREEN_WIDTH + 50
-                bird['y'] = random.randint(80, 200)
-        
-        # 更新云朵位置（所有云朵都要动起来，但速度更慢）
-        for cloud in self.clouds:
-            # 横向移动（速度减慢）
-            cloud['x'] -= cloud['speed'] * 0.5  # 云朵速度减慢，更自然
-            # 添加轻微的上下飘动（幅度更大，更明显）
-            cloud['wobble'] += 0.04  # 减慢上下飘动频率
-            # 确保wobble值在合理范围内
-            if cloud['wobble'] > 6.28:
-                cloud['wobble'] -= 6.28
-            
-            # 如果云朵离开屏幕，重新生成
-            if cloud['x'] + cloud['size'] * 2 < 0:
-                cloud['x'] = SCREEN_WIDTH + cloud['size']
-                cloud['y'] = random.randint(50, SCREEN_HEIGHT // 2)
-                cloud['size'] = random.randint(25, 45)
-                cloud['speed'] = random.uniform(0.2, 0.6)  # 速度范围减小
-                cloud['puffiness'] = random.uniform(0.8, 1.2)
-                cloud['wobble'] = random.uniform(0, 6.28)
-                cloud['alpha'] = random.randint(220, 245)
+        import numpy as np
+
+        # 更新远景飞鸟：位置和翅膀相位整体向量推进，逐只处理仅限回收
+        self._bird_x -= self._bird_speed
+        self._bird_phase += 0.15
+        for i in np.nonzero(self._bird_x < -50)[0]:
+            self._bird_x[i] = SCREEN_WIDTH + 50
+            self._bird_y[i] = _rand_pool.randint(80, 200)
+
+        # 更新云朵：横移（速度减慢更自然）+上下飘动相位一次算完
+        self._cloud_x -= self._cloud_vx * 0.5
+        self._cloud_wobble += 0.04  # 减慢上下飘动频率
+        # 确保wobble值在合理范围内
+        self._cloud_wobble[self._cloud_wobble > 6.28] -= 6.28
+
+        # 如果云朵离开屏幕，重新生成
+        for i in np.nonzero(self._cloud_x + self._cloud_size * 2 < 0)[0]:
+            self._cloud_x[i] = SCREEN_WIDTH + self._cloud_size[i]
+            self._cloud_y[i] = _rand_pool.randint(50, SCREEN_HEIGHT // 2)
+            self._cloud_size[i] = _rand_pool.randint(25, 45)
+            self._cloud_vx[i] = _rand_pool.uniform(0.2, 0.6)  # 速度范围减小
+            self._cloud_puff[i] = _rand_pool.uniform(0.8, 1.2)
+            self._cloud_wobble[i] = _rand_pool.uniform(0, 6.28)
+            self._cloud_alpha[i] = _rand_pool.randint(220, 245)
+            # 外观变了，换持有的预渲染Surface
+            self._cloud_surfs[i] = self._get_cloud_sprite(
+                int(self._cloud_size[i]), self._cloud_puff[i], self._cloud_alpha[i])
         
         # 更新草叶摇摆动画（适中的速度）
         self.grass_wave += 0.1  # 适中的摆动速度
@@ -813,149 +1284,93 @@ class Background:
             screen.blit(self.background_image, (self.bg_scroll_x + SCREEN_WIDTH, 0))
             return  # 使用自定义背景时不绘制云朵
         
-        # 否则绘制默认的天空渐变（带呼吸效果，优化性能）
+        # 否则blit预先烘焙的天空渐变（见__init__的LUT，保留呼吸明暗效果）
         time_cycle = pygame.time.get_ticks() / 5000.0  # 5秒一个周期
-        sky_brightness = math.sin(time_cycle) * 5  # 天空明暗变化
-        
-        # 使用较大的步长绘制渐变，提高性能
-        for y in range(0, SCREEN_HEIGHT, 2):  # 每2像素一行，减少绘制次数
-            # 从明亮的天空蓝到浅蓝的渐变，带呼吸效果（更明亮）
-            ratio = y / SCREEN_HEIGHT
-            r = int(160 + (200 - 160) * ratio + sky_brightness)  # 更亮的红色
-            g = int(220 + (235 - 220) * ratio + sky_brightness)  # 更亮的绿色
-            b = int(255 + (255 - 255) * ratio + sky_brightness)  # 最亮的蓝色
-            # 确保颜色值在有效范围内
-            r = max(0, min(255, r))
-            g = max(0, min(255, g))
-            b = max(0, min(255, b))
-            color = (r, g, b)
-            pygame.draw.line(screen, color, (0, y), (SCREEN_WIDTH, y))
+        brightness = int(round(sin_lut(time_cycle) * 5))  # 天空明暗变化
+        screen.blit(self._sky_variants[brightness + 5], (0, 0))
         
         # 绘制太阳（带光晕效果）
         sun_x = SCREEN_WIDTH - 100
         sun_radius = 30
-        # 光晕（多层）
-        for i in range(3):
-            glow_radius = sun_radius + (i + 1) * 10
-            glow_alpha = 30 - i * 8
-            glow_surface = pygame.Surface((glow_radius * 2, glow_radius * 2), pygame.SRCALPHA)
-            pygame.draw.circle(glow_surface, (255, 255, 150, glow_alpha), 
-                             (glow_radius, glow_radius), glow_radius)
+        # 光晕（多层，预渲染见__init__）
+        for glow_surface, glow_radius in self._sun_glows:
             screen.blit(glow_surface, (sun_x - glow_radius, int(self.sun_y) - glow_radius))
         # 太阳主体
         pygame.draw.circle(screen, (255, 255, 100), (sun_x, int(self.sun_y)), sun_radius)
         pygame.draw.circle(screen, (255, 255, 200), (sun_x - 5, int(self.sun_y) - 5), sun_radius // 3)  # 高光
         
-        # 先绘制远景飞鸟（小剪影）和云朵（在后面）
-        for bird in self.distant_birds:
-            bird_x = int(bird['x'])
-            bird_y = int(bird['y'])
-            wing_offset = int(math.sin(bird['wing_phase']) * 3)
-            
-            # 简单的V字形飞鸟
-            bird_color = (80, 80, 100, 150)  # 半透明的暗色
-            bird_surface = pygame.Surface((15, 8), pygame.SRCALPHA)
-            # 左翅膀
-            pygame.draw.line(bird_surface, bird_color, (7, 4), (2, 1 + wing_offset), 2)
-            # 右翅膀
-            pygame.draw.line(bird_surface, bird_color, (7, 4), (12, 1 + wing_offset), 2)
-            screen.blit(bird_surface, (bird_x, bird_y))
-        
-        # 绘制云朵（在天空图层）
-        for cloud in self.clouds:
-            # 绘制更真实生动的云朵
-            center_x = int(cloud['x'])
-            center_y = int(cloud['y'] + math.sin(cloud['wobble']) * 5)  # 增加上下飘动幅度
-            size = cloud['size']
-            puff = cloud['puffiness']
-            
-            # 创建一个透明的surface来绘制云朵
-            cloud_surface = pygame.Surface((size * 3, size * 2), pygame.SRCALPHA)
-            
-            # 云朵底部阴影（柔和的灰色）
-            shadow_color = (210, 210, 220, cloud['alpha'] - 50)
-            pygame.draw.ellipse(cloud_surface, shadow_color, 
-                              (size//4, int(size * 1.3), int(size * 2.5), size//3))
-            
-            # 云朵主体 - 简化版本，减少圆形数量以提高性能
-            # 中央大圆
-            pygame.draw.circle(cloud_surface, (255, 255, 255, cloud['alpha']), 
-                             (int(size * 1.2), size), int(size * puff))
-            
-            # 左侧（减少细节）
-            pygame.draw.circle(cloud_surface, (255, 255, 255, cloud['alpha']), 
-                             (int(size * 0.7), int(size * 1.1)), int(size * 0.7 * puff))
-            
-            # 右侧（减少细节）
-            pygame.draw.circle(cloud_surface, (255, 255, 255, cloud['alpha']), 
-                             (int(size * 1.8), int(size * 1.05)), int(size * 0.8 * puff))
-            
-            # 顶部
-            pygame.draw.circle(cloud_surface, (255, 255, 255, cloud['alpha']), 
-                             (int(size * 1.1), int(size * 0.7)), int(size * 0.6 * puff))
-            
-            # 将云朵绘制到屏幕上
-            screen.blit(cloud_surface, (center_x - size, center_y - size))
+        import numpy as np
+
+        # 先绘制远景飞鸟（小剪影）：翅膀偏移整批向量算出，逐只只剩精灵查表和blit
+        wing_offsets = (np.sin(self._bird_phase) * 3).astype(np.int64)
+        bird_blits = [(self._get_distant_bird_sprite(int(wing_offsets[i])),
+                       (int(self._bird_x[i]), int(self._bird_y[i])))
+                      for i in range(len(wing_offsets))]
+        batch_blit(screen, bird_blits)
+
+        # 绘制云朵（在天空图层）：上下飘动的y偏移整批算出，
+        # 每朵云直接blit自己持有的预渲染Surface
+        cloud_ys = (self._cloud_y + np.sin(self._cloud_wobble) * 5).astype(np.int64)
+        cloud_blits = [
+            (self._cloud_surfs[i],
+             (int(self._cloud_x[i] - self._cloud_size[i]),
+              int(cloud_ys[i] - self._cloud_size[i])))
+            for i in range(len(cloud_ys))
+        ]
+        batch_blit(screen, cloud_blits)
         
-        # 绘制草地（更浅更明亮的绿色，优化性能）
+        # 草地渐变已烘焙进天空Surface（见__init__），此处无需单独blit
         grass_height = 80
-        grass_start_y = SCREEN_HEIGHT - grass_height
-        for y in range(grass_start_y, SCREEN_HEIGHT, 2):  # 每2像素一行
-            # 从浅绿到较深的绿的渐变（更明亮）
-            ratio = (y - grass_start_y) / grass_height
-            r = int(140 + (80 - 140) * ratio)  # 更亮的红色
-            g = int(220 + (180 - 220) * ratio)  # 更亮的绿色
-            b = int(140 + (80 - 140) * ratio)  # 更亮的蓝色
-            color = (r, g, b)
-            pygame.draw.line(screen, color, (0, y), (SCREEN_WIDTH, y))
-        
-        # 绘制草地上的草叶（使用预生成数据，添加微弱的摇摆动画）
+
+        # 绘制草地上的草叶：按摇摆相位取预渲染长条（见__init__的LUT）
         grass_base_y = SCREEN_HEIGHT - grass_height
+        strip_index = int(self.grass_wave / (2 * math.pi) * 16) % 16
+        screen.blit(self._grass_strips[strip_index], (0, grass_base_y - self._grass_strip_h))
         
-        # 计算微弱的摇摆动画（使用正弦波模拟微风）
-        wave_offset = math.sin(self.grass_wave) * 0.3  # 极其轻微的摇摆，几乎静止
-        
-        # 使用预生成的草叶数据绘制
-        for blade in self.grass_blades:
-            # 根据草叶位置计算摇摆幅度（远处的草摇摆更明显）
-            grass_x_pos = blade['x'] / SCREEN_WIDTH
-            local_wave = wave_offset * (0.7 + grass_x_pos * 0.3)  # 渐变摇摆效果
-            
-            # 计算草叶顶端位置（加上摇摆）
-            tip_x = blade['x'] + blade['angle'] * blade['height'] + local_wave * (1 + blade['height'] / 30)
-            tip_y = blade['base_y'] - blade['height']
-            
-            # 绘制主草叶（单根草，提高性能）
-            pygame.draw.line(screen, blade['color'], 
-                           (blade['x'], blade['base_y']), (tip_x, tip_y), 2)
-        
-        # 绘制小花（草地上的装饰）
-        # 使用系统的云朵wobble来同步花朵的轻微摆动
+        # 绘制小花（草地上的装饰）：整株按(颜色, 摆动偏移)取预渲染精灵，纯批量blit
         flower_time = pygame.time.get_ticks() / 500.0
+        flower_blits = []
         for i in range(8):  # 8朵花
             flower_x = (i * 100 + 50) % SCREEN_WIDTH
-            flower_y = SCREEN_HEIGHT - grass_height - 5 + int(math.sin(flower_time * 2 + i) * 2)
-            
-            # 花茎
-            pygame.draw.line(screen, (50, 150, 50), 
-                           (flower_x, SCREEN_HEIGHT - grass_height),
-                           (flower_x, flower_y), 2)
-            
-            # 花朵（不同颜色）
-            flower_colors = [(255, 182, 193), (255, 20, 147), (255, 255, 0), (255, 165, 0)]
-            flower_color = flower_colors[i % len(flower_colors)]
-            
-            # 花瓣
-            for angle in range(0, 360, 60):
-                rad = math.radians(angle)
-                petal_x = flower_x + int(math.cos(rad) * 5)
-                petal_y = flower_y + int(math.sin(rad) * 5)
-                pygame.draw.circle(screen, flower_color, (petal_x, petal_y), 3)
-            
-            # 花心
-            pygame.draw.circle(screen, (255, 200, 0), (flower_x, flower_y), 3)
+            sway = int(sin_lut(flower_time * 2 + i) * 2)
+            flower_y = SCREEN_HEIGHT - grass_height - 5 + sway
+            flower_blits.append((self._flower_sprites[(i % len(FLOWER_COLORS), sway)],
+                                 (flower_x - 8, flower_y - 8)))
+        batch_blit(screen, flower_blits)
 
 class PowerUp:
+    # 预渲染的道具精灵缓存：key为(类型, 发光强度档)，3种类型×8档共24张，
+    # 每个道具每帧从4次圆形光栅化变成1次blit
+    _sprite_cache = {}
+    _GLOW_BUCKETS = 8
+    _BASE_COLORS = {'shield': BLUE, 'slow_motion': YELLOW, 'double_score': RED}
+
+    @classmethod
+    def _get_sprite(cls, powerup_type, bucket):
+        key = (powerup_type, bucket)
+        sprite = cls._sprite_cache.get(key)
+        if sprite is None:
+            base_color = cls._BASE_COLORS[powerup_type]
+            glow_intensity = (bucket + 0.5) / cls._GLOW_BUCKETS
+            glow_radius = int(15 + glow_intensity * 5)
+            center = glow_radius
+            sprite = pygame.Surface((glow_radius * 2, glow_radius * 2), pygame.SRCALPHA)
+
+            # 发光效果
+            glow_color = tuple(int(c * 0.3) for c in base_color)
+            pygame.draw.circle(sprite, glow_color, (center, center), glow_radius)
+
+            # 道具主体
+            pygame.draw.circle(sprite, base_color, (center, center), 10)
+            pygame.draw.circle(sprite, BLACK, (center, center), 10, 2)
+
+            # 内部装饰
+            inner_color = tuple(min(255, c + 50) for c in base_color)
+            pygame.draw.circle(sprite, inner_color, (center, center), 6)
+
+            sprite = cls._sprite_cache[key] = sprite.convert_alpha()
+        return sprite
+
     def __init__(self, x, y):
         self.x = x
         self.y = y
@@ -971,32 +1386,18 @@ class PowerUp:
         """更新道具位置和动画"""
         self.x -= self.speed
         self.animation += 0.2
-        self.glow_intensity = math.sin(self.animation) * 0.5 + 0.5
-        
+        self.glow_intensity = sin_lut(self.animation) * 0.5 + 0.5
+        
+    def blit_pair(self):
+        """返回(精灵, 位置)，按发光强度档取预渲染精灵，供Game层批量blit"""
+        bucket = min(self._GLOW_BUCKETS - 1, int(self.glow_intensity * self._GLOW_BUCKETS))
+        sprite = self._get_sprite(self.type, bucket)
+        half = sprite.get_width() // 2
+        return sprite, (int(self.x) - half, int(self.y) - half)
+
     def draw(self, screen):
         """绘制美化的道具"""
-        center_x = int(self.x)
-        center_y = int(self.y)
-        
-        if self.type == 'shield':
-            base_color = BLUE
-        elif self.type == 'slow_motion':
-            base_color = YELLOW
-        else:  # double_score
-            base_color = RED
-            
-        # 发光效果
-        glow_radius = int(15 + self.glow_intensity * 5)
-        glow_color = tuple(int(c * 0.3) for c in base_color)
-        pygame.draw.circle(screen, glow_color, (center_x, center_y), glow_radius)
-        
-        # 道具主体
-        pygame.draw.circle(screen, base_color, (center_x, center_y), self.width//2)
-        pygame.draw.circle(screen, BLACK, (center_x, center_y), self.width//2, 2)
-        
-        # 内部装饰
-        inner_color = tuple(min(255, c + 50) for c in base_color)
-        pygame.draw.circle(screen, inner_color, (center_x, center_y), self.width//3)
+        screen.blit(*self.blit_pair())
         
     def get_rect(self):
         """获取道具的碰撞矩形"""
@@ -1024,20 +1425,22 @@ class MovingPipe(Pipe):
             self.move_direction *= -1
             self.move_timer = 0
             
-        self.top_height += self.move_direction * self.move_speed
+        # 限制移动范围：无分支的min/max钳制，触边时反向
+        top_max = SCREEN_HEIGHT - self.gap - 50
+        self.top_height = max(50, min(top_max, self.top_height + self.move_direction * self.move_speed))
         self.bottom_y = self.top_height + self.gap
-        
-        # 限制移动范围
-        if self.top_height < 50:
-            self.top_height = 50
-            self.move_direction = 1
-        elif self.top_height > SCREEN_HEIGHT - self.gap - 50:
-            self.top_height = SCREEN_HEIGHT - self.gap - 50
-            self.move_direction = -1
+        self.move_direction = (1 if self.top_height <= 50
+                               else (-1 if self.top_height >= top_max else self.move_direction))
 
 class Game:
     def __init__(self):
-        self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+        # 尽量走SDL2的纹理呈现路径：SCALED模式下帧缓冲作为纹理交给GPU
+        # 缩放与present；个别平台/驱动不支持时退回纯软件窗口
+        try:
+            self.screen = pygame.display.set_mode(
+                (SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SCALED | pygame.DOUBLEBUF)
+        except pygame.error:
+            self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
         pygame.display.set_caption("飞翔的小鸟")
         self.clock = pygame.time.Clock()
         self.running = True
@@ -1100,9 +1503,9 @@ class Game:
         self.pipe_spawn_timer = 0
         self.powerup_spawn_timer = 0
         
-        # 难度相关
-        settings = DIFFICULTY_SETTINGS[self.difficulty]
-        self.pipe_spawn_interval = settings["pipe_spawn_interval"]
+        # 难度相关：当前难度的设置缓存起来，换难度时才重新取
+        self._settings = DIFFICULTY_SETTINGS[self.difficulty]
+        self.pipe_spawn_interval = self._settings["pipe_spawn_interval"]
         self.powerup_spawn_interval = 300  # 帧数
         
         # 游戏状态
@@ -1118,17 +1521,117 @@ class Game:
         self.settings_selection = 0
         self.difficulty_selection = 0
         self.volume_dragging = False
-        
+
+        # 预先构建各界面的鼠标命中矩形（与绘制位置一致），
+        # 事件处理用collidepoint替代逐项的坐标比较链
+        cx = SCREEN_WIDTH // 2
+        self._menu_click_rects = [pygame.Rect(cx - 200, 200 + i * 80 - 10, 401, 51)
+                                  for i in range(3)]
+        self._menu_hover_rects = [pygame.Rect(cx - 200, 220 + i * 80 - 10, 401, 51)
+                                  for i in range(3)]
+        self._settings_rects = [pygame.Rect(cx - 200, 220 + i * 80 - 10, 401, 51)
+                                for i in range(3)]
+        self._difficulty_rects = [pygame.Rect(cx - 250, 220 + i * 100 - 15, 501, 71)
+                                  for i in range(3)]
+        self._back_button_rect = pygame.Rect(20, 20, 81, 36)
+        # 音量滑块的点击区域（比滑块本体四周各扩10px，更容易点中）
+        self._volume_slider_rect = pygame.Rect(cx + 80 - 10, 220 + 80 - 10 - 10, 221, 41)
+
+        # 各界面的布局表：选项文字、高亮Rect和行y坐标在此一次算好，
+        # 绘制函数只做紧凑的查表循环
+        self._menu_layout = [
+            (icon, option, pygame.Rect(cx - 200, 220 + i * 80 - 20, 400, 50), 220 + i * 80)
+            for i, (icon, option) in enumerate(
+                [("[1]", "开始游戏"), ("[2]", "游戏设置"), ("[3]", "退出游戏")])
+        ]
+        self._settings_layout = [
+            (icon, name, pygame.Rect(cx - 200, 220 + i * 80 - 20, 400, 50), 220 + i * 80)
+            for i, (icon, name) in enumerate(
+                [("[1]", "游戏难度"), ("[2]", "音效音量"), ("[3]", "返回主菜单")])
+        ]
+        self._difficulty_layout = [
+            (name, DIFFICULTY_DESCRIPTIONS[name],
+             pygame.Rect(cx - 250, 220 + i * 100 - 25, 500, 70), 220 + i * 100)
+            for i, name in enumerate(DIFFICULTY_KEYS)
+        ]
+
+        # 绘制分派表：state -> 对应的绘制方法，draw()里一次dict查找
+        self._draw_dispatch = {
+            "MENU": self.draw_menu,
+            "PLAYING": self.draw_game,
+            "GAME_OVER": self.draw_game_over,
+            "SETTINGS": self.draw_settings,
+            "DIFFICULTY_SELECT": self.draw_difficulty_select,
+        }
+
+        # 悬停处理的数据表：state -> (命中矩形列表, 选中项属性名)，
+        # 三个界面的MOUSEMOTION分支合并成一段查表逻辑
+        self._hover_tables = {
+            "MENU": (self._menu_hover_rects, "menu_selection"),
+            "SETTINGS": (self._settings_rects, "settings_selection"),
+            "DIFFICULTY_SELECT": (self._difficulty_rects, "difficulty_selection"),
+        }
+
         # 倒计时相关
         self.countdown_timer = 0
         self.countdown_active = False
         self.countdown_text = ""
+
+        # 文字渲染缓存：key为(内容, 字体, 颜色)，见draw_text
+        self._text_cache = {}
+
+        # HUD文字缓存：按槽位存(值, Surface)，值不变就不重新渲染，见_hud_surf
+        self._hud_cache = {}
+
+        # 字形缓存：数字0-9按HUD用到的颜色预先渲染，动态数值组字零FreeType调用
+        self._glyph_cache = {}
+        for glyph_color in (BLACK, BLUE, YELLOW, RED):
+            for ch in "0123456789":
+                self._glyph(ch, self.font, glyph_color)
+
+        # 暂停画面是否已经绘制过（暂停期间画面静止，只推送一帧）
+        self._pause_frame_drawn = False
+
+        # 护盾光环精灵缓存（按半径取用，见draw_game）
+        self._shield_sprites = {}
+
+        # 预构建的选中高亮条（半透明底+不透明描边一次画好，每帧只剩一次blit）
+        self._highlight_menu = self._build_highlight(400, 50)
+        self._highlight_difficulty = self._build_highlight(500, 70)
+
+        # 预构建的返回按钮（白底黑框，设置/难度界面共用）
+        self._back_button_chrome = pygame.Surface((80, 35)).convert()
+        self._back_button_chrome.fill(WHITE)
+        pygame.draw.rect(self._back_button_chrome, BLACK, self._back_button_chrome.get_rect(), 2)
+
+        # 预构建的音量滑轨（灰底黑框，滑块本身每帧单独画）
+        self._slider_track = pygame.Surface((200, 20)).convert()
+        self._slider_track.fill(GRAY)
+        pygame.draw.rect(self._slider_track, BLACK, self._slider_track.get_rect(), 2)
+
+    @staticmethod
+    def _build_highlight(width, height):
+        """构建选中高亮条：淡黄底色+黄色描边合在一张Surface里"""
+        surf = pygame.Surface((width, height), pygame.SRCALPHA)
+        surf.fill((*YELLOW, 30))
+        pygame.draw.rect(surf, YELLOW, surf.get_rect(), 2)
+        return surf.convert_alpha()
     
+    def _text_pair(self, text, font, color, x, y):
+        """取缓存的文字Surface并摆好位置，返回(Surface, Rect)供批量blit
+        （只缓存Surface，Rect每次新建——blit被攒到帧末才执行，
+        共享Rect会让同帧重复文字全部画到最后一个位置）"""
+        key = (text, id(font), color)
+        surf = self._text_cache.get(key)
+        if surf is None:
+            surf = self._text_cache[key] = font.render(text, True, color)
+        return surf, surf.get_rect(center=(x, y))
+
     def draw_text(self, text, font, color, x, y):
-        """绘制普通文字"""
-        text_surface = font.render(text, True, color)
-        text_rect = text_surface.get_rect(center=(x, y))
-        self.screen.blit(text_surface, text_rect)
+        """绘制单条居中文字（缓存见_text_pair）"""
+        surf, rect = self._text_pair(text, font, color, x, y)
+        self.screen.blit(surf, rect)
+        return rect
         
     def handle_events(self):
         """处理游戏事件"""
@@ -1173,8 +1676,7 @@ class Game:
                             self.state = "MENU"
                     elif self.state == "DIFFICULTY_SELECT":
                         # 选择难度并直接开始游戏
-                        difficulties = list(DIFFICULTY_SETTINGS.keys())
-                        self.difficulty = difficulties[self.difficulty_selection]
+                        self.difficulty = DIFFICULTY_KEYS[self.difficulty_selection]
                         self.sound_manager.play_sound('menu_confirm')
                         self.start_game()
                 elif event.key == pygame.K_UP:
@@ -1215,10 +1717,8 @@ class Game:
                     
                     if self.state == "MENU":
                         # 检查是否点击了菜单选项
-                        for i in range(3):
-                            y_pos = 200 + i * 80
-                            if (SCREEN_WIDTH//2 - 200 <= mouse_x <= SCREEN_WIDTH//2 + 200 and 
-                                y_pos - 10 <= mouse_y <= y_pos + 40):
+                        for i, rect in enumerate(self._menu_click_rects):
+                            if rect.collidepoint(mouse_x, mouse_y):
                                 self.menu_selection = i
                                 self.sound_manager.play_sound('menu_select')
                                 if i == 0:  # 开始游戏
@@ -1235,15 +1735,13 @@ class Game:
                         self.start_game()
                     elif self.state == "SETTINGS":
                         # 检查是否点击了左上角返回按钮
-                        if (20 <= mouse_x <= 100 and 20 <= mouse_y <= 55):
+                        if self._back_button_rect.collidepoint(mouse_x, mouse_y):
                             self.sound_manager.play_sound('menu_select')
                             self.state = "MENU"
                         # 检查是否点击了设置选项
                         else:
-                            for i in range(3):
-                                y_pos = 220 + i * 80  # 与绘制位置一致
-                                if (SCREEN_WIDTH//2 - 200 <= mouse_x <= SCREEN_WIDTH//2 + 200 and 
-                                    y_pos - 10 <= mouse_y <= y_pos + 40):
+                            for i, rect in enumerate(self._settings_rects):
+                                if rect.collidepoint(mouse_x, mouse_y):
                                     self.settings_selection = i
                                     self.sound_manager.play_sound('menu_select')
                                     if i == 0:  # 游戏难度
@@ -1251,35 +1749,26 @@ class Game:
                                     elif i == 2:  # 返回主菜单
                                         self.state = "MENU"
                                     break
-                        
-                        # 检查是否点击了音量滑块（扩大点击区域）
-                        slider_x = SCREEN_WIDTH//2 + 80  # 与绘制位置一致
-                        slider_y = 220 + 1 * 80 - 10  # 音量选项的Y位置（i=1的y_pos - 10）
-                        slider_width = 200
-                        slider_height = 20
-                        
-                        # 扩大点击区域，让滑块更容易点击
-                        if (slider_x - 10 <= mouse_x <= slider_x + slider_width + 10 and 
-                            slider_y - 10 <= mouse_y <= slider_y + slider_height + 10):
+
+                        # 检查是否点击了音量滑块（点击区域已扩大，见__init__）
+                        if self._volume_slider_rect.collidepoint(mouse_x, mouse_y):
                             self.volume_dragging = True
                             # 立即设置音量
-                            volume = max(0, min(1, (mouse_x - slider_x) / slider_width))
+                            slider_x = CX + 80  # 与绘制位置一致
+                            volume = max(0, min(1, (mouse_x - slider_x) / 200))
                             self.sound_manager.set_sound_volume(volume)
                     elif self.state == "DIFFICULTY_SELECT":
                         # 检查是否点击了左上角返回按钮
-                        if (20 <= mouse_x <= 100 and 20 <= mouse_y <= 55):
+                        if self._back_button_rect.collidepoint(mouse_x, mouse_y):
                             self.sound_manager.play_sound('menu_select')
                             self.state = "SETTINGS"
                         # 检查是否点击了难度选项
                         else:
-                            difficulties = list(DIFFICULTY_SETTINGS.keys())
-                            for i, difficulty in enumerate(difficulties):
-                                y_pos = 220 + i * 100  # 与绘制位置一致
-                                if (SCREEN_WIDTH//2 - 250 <= mouse_x <= SCREEN_WIDTH//2 + 250 and 
-                                    y_pos - 15 <= mouse_y <= y_pos + 55):
+                            for i, rect in enumerate(self._difficulty_rects):
+                                if rect.collidepoint(mouse_x, mouse_y):
                                     self.difficulty_selection = i
                                     self.sound_manager.play_sound('menu_select')
-                                    self.difficulty = difficulty
+                                    self.difficulty = DIFFICULTY_KEYS[i]
                                     self.start_game()
                                     break
             elif event.type == pygame.MOUSEBUTTONUP:
@@ -1288,42 +1777,22 @@ class Game:
             elif event.type == pygame.MOUSEMOTION:
                 if self.volume_dragging and self.state == "SETTINGS":
                     mouse_x, mouse_y = pygame.mouse.get_pos()
-                    slider_x = SCREEN_WIDTH//2 + 80  # 与绘制位置一致
+                    slider_x = CX + 80  # 与绘制位置一致
                     slider_width = 200
                     
                     # 计算音量值
                     volume = max(0, min(1, (mouse_x - slider_x) / slider_width))
                     self.sound_manager.set_sound_volume(volume)
                 else:
-                    # 鼠标悬停效果
-                    mouse_x, mouse_y = pygame.mouse.get_pos()
-                    
-                    if self.state == "MENU":
-                        for i in range(3):
-                            y_pos = 220 + i * 80  # 与绘制位置一致
-                            if (SCREEN_WIDTH//2 - 200 <= mouse_x <= SCREEN_WIDTH//2 + 200 and 
-                                y_pos - 10 <= mouse_y <= y_pos + 40):
-                                if self.menu_selection != i:
-                                    self.menu_selection = i
-                                    self.sound_manager.play_sound('menu_select')
-                                break
-                    elif self.state == "SETTINGS":
-                        for i in range(3):
-                            y_pos = 220 + i * 80  # 与绘制位置一致
-                            if (SCREEN_WIDTH//2 - 200 <= mouse_x <= SCREEN_WIDTH//2 + 200 and 
-                                y_pos - 10 <= mouse_y <= y_pos + 40):
-                                if self.settings_selection != i:
-                                    self.settings_selection = i
-                                    self.sound_manager.play_sound('menu_select')
-                                break
-                    elif self.state == "DIFFICULTY_SELECT":
-                        difficulties = list(DIFFICULTY_SETTINGS.keys())
-                        for i, difficulty in enumerate(difficulties):
-                            y_pos = 220 + i * 100  # 与绘制位置一致
-                            if (SCREEN_WIDTH//2 - 250 <= mouse_x <= SCREEN_WIDTH//2 + 250 and 
-                                y_pos - 15 <= mouse_y <= y_pos + 55):
-                                if self.difficulty_selection != i:
-                                    self.difficulty_selection = i
+                    # 鼠标悬停效果：查表驱动，见__init__的_hover_tables
+                    table = self._hover_tables.get(self.state)
+                    if table:
+                        mouse_x, mouse_y = pygame.mouse.get_pos()
+                        rects, attr = table
+                        for i, rect in enumerate(rects):
+                            if rect.collidepoint(mouse_x, mouse_y):
+                                if getattr(self, attr) != i:
+                                    setattr(self, attr, i)
                                     self.sound_manager.play_sound('menu_select')
                                 break
     
@@ -1347,11 +1816,11 @@ class Game:
         self.double_score_timer = 0
         
         # 清空粒子系统（不重新创建对象）
-        self.particle_system.particles = []
+        self.particle_system.clear()
         
         # 更新难度设置
-        settings = DIFFICULTY_SETTINGS[self.difficulty]
-        self.pipe_spawn_interval = settings["pipe_spawn_interval"]
+        self._settings = DIFFICULTY_SETTINGS[self.difficulty]
+        self.pipe_spawn_interval = self._settings["pipe_spawn_interval"]
         
         # 开始倒计时
         self.countdown_active = True
@@ -1415,89 +1884,119 @@ class Game:
             # 生成新管道
             self.pipe_spawn_timer += 1
             if self.pipe_spawn_timer >= self.pipe_spawn_interval:
-                settings = DIFFICULTY_SETTINGS[self.difficulty]
-                
-                # 根据难度设置选择管道类型
-                if settings["has_moving_pipes"] and random.random() < 0.4:  # 40%概率生成移动管道
+                # 根据难度设置选择管道类型（设置已在start_game时缓存）
+                if self._settings["has_moving_pipes"] and random.random() < 0.4:  # 40%概率生成移动管道
                     self.pipes.append(MovingPipe(SCREEN_WIDTH, self.difficulty))
                 else:
                     self.pipes.append(Pipe(SCREEN_WIDTH, self.difficulty))
                 self.pipe_spawn_timer = 0
             
             # 生成道具（仅在中等和难模式下）
-            settings = DIFFICULTY_SETTINGS[self.difficulty]
-            if settings["has_powerups"]:
+            if self._settings["has_powerups"]:
                 self.powerup_spawn_timer += 1
                 if self.powerup_spawn_timer >= self.powerup_spawn_interval:
                     y = random.randint(100, SCREEN_HEIGHT - 100)
                     self.powerups.append(PowerUp(SCREEN_WIDTH, y))
                     self.powerup_spawn_timer = 0
             
-            # 更新管道
-            for pipe in self.pipes[:]:
+            # 小鸟包围盒每帧只取一次，管道和道具的判定共用这组整数
+            bx, by = int(self.bird.x), int(self.bird.y)
+            bw, bh = self.bird.width, self.bird.height
+
+            # 更新管道：先统一推进位置，再用NumPy的SoA数组一次性做
+            # 碰撞/得分/出屏判定，替代逐管道的colliderect调用
+            for pipe in self.pipes:
                 if not self.slow_motion_active:
                     pipe.update()
                 else:
                     # 慢动作效果：管道移动速度减半
                     pipe.x -= pipe.speed // 2
-                
-                # 检查碰撞
-                bird_rect = self.bird.get_rect()
-                top_rect, bottom_rect = pipe.get_rects()
-                
-                if bird_rect.colliderect(top_rect) or bird_rect.colliderect(bottom_rect):
-                    if not self.shield_active:
-                        self.state = "GAME_OVER"
-                        self.sound_manager.play_sound('crash')
-                        # 停止背景音乐
-                        self.sound_manager.stop_background_music()
-                        # 添加爆炸粒子效果
-                        self.particle_system.add_explosion(
-                            self.bird.x + self.bird.width//2,
-                            self.bird.y + self.bird.height//2,
-                            RED, 15
-                        )
-                        break
-                
-                # 检查得分
-                if pipe.is_passed(self.bird.x) and not hasattr(pipe, 'scored'):
-                    score_increase = 2 if self.double_score_active else 1
-                    self.score += score_increase
-                    pipe.scored = True
-                    self.sound_manager.play_sound('score')
-                    
-                    # 更新最高分
-                    if self.score > self.high_score:
-                        self.high_score = self.score
-                
-                # 移除离开屏幕的管道
-                if pipe.is_off_screen():
-                    self.pipes.remove(pipe)
-            
-            # 更新道具
-            for powerup in self.powerups[:]:
+
+            if self.pipes:
+                import numpy as np
+                n = len(self.pipes)
+                pipe_x = np.fromiter((p.x for p in self.pipes), dtype=np.int64, count=n)
+                top_h = np.fromiter((p.top_height for p in self.pipes), dtype=np.int64, count=n)
+                bottom_y = np.fromiter((p.bottom_y for p in self.pipes), dtype=np.int64, count=n)
+                pipe_w = self.pipes[0].width
+
+                # AABB重叠测试，与pygame.Rect.colliderect同语义（边缘相触不算碰撞）。
+                # 先做x区间的快速剔除：大多数帧没有管道与小鸟横向重叠，
+                # 此时完全不必做y向测试
+                overlap_x = (bx + bw > pipe_x) & (bx < pipe_x + pipe_w)
+                crashed = False
+                if overlap_x.any():
+                    hit = overlap_x & ((by < top_h) | (by + bh > bottom_y))
+                    crashed = bool(hit.any()) and not self.shield_active
+
+                if crashed:
+                    self.state = "GAME_OVER"
+                    self.sound_manager.play_sound('crash')
+                    # 停止背景音乐
+                    self.sound_manager.stop_background_music()
+                    # 添加爆炸粒子效果
+                    self.particle_system.add_explosion(
+                        self.bird.x + self.bird.width//2,
+                        self.bird.y + self.bird.height//2,
+                        RED, 15
+                    )
+                else:
+                    # 检查得分：掩码筛出已通过的管道，再回到Python处理副作用
+                    passed = bx > pipe_x + pipe_w
+                    for i in np.nonzero(passed)[0]:
+                        pipe = self.pipes[i]
+                        if pipe.scored:
+                            continue
+                        score_increase = 2 if self.double_score_active else 1
+                        self.score += score_increase
+                        pipe.scored = True
+                        self.sound_manager.play_sound('score')
+
+                        # 更新最高分
+                        if self.score > self.high_score:
+                            self.high_score = self.score
+
+                    # 丢弃离开屏幕的管道
+                    keep = pipe_x + pipe_w >= 0
+                    if not keep.all():
+                        self.pipes = [p for p, k in zip(self.pipes, keep) if k]
+
+            # 更新道具：同样先推进位置，再用掩码判定收集/出屏
+            for powerup in self.powerups:
                 if not self.slow_motion_active:
                     powerup.update()
                 else:
                     # 慢动作效果：道具移动速度减半
                     powerup.x -= powerup.speed // 2
-                
-                # 检查道具收集
-                bird_rect = self.bird.get_rect()
-                if bird_rect.colliderect(powerup.get_rect()) and not powerup.collected:
+
+            if self.powerups:
+                import numpy as np
+                n = len(self.powerups)
+                pu_x = np.fromiter((p.x for p in self.powerups), dtype=np.int64, count=n)
+                pu_y = np.fromiter((p.y for p in self.powerups), dtype=np.int64, count=n)
+                pu_w = self.powerups[0].width
+                half_w = pu_w // 2
+                half_h = self.powerups[0].height // 2
+
+                # 道具碰撞矩形以(x, y)为中心
+                got = ((bx + bw > pu_x - half_w) & (bx < pu_x + half_w) &
+                       (by + bh > pu_y - half_h) & (by < pu_y + half_h))
+
+                for i in np.nonzero(got)[0]:
+                    powerup = self.powerups[i]
                     powerup.collected = True
                     self.collect_powerup(powerup)
                     self.sound_manager.play_sound('powerup')
                     # 添加收集粒子效果
                     self.particle_system.add_explosion(
-                        powerup.x, powerup.y, powerup.type == 'shield' and BLUE or 
+                        powerup.x, powerup.y, powerup.type == 'shield' and BLUE or
                         powerup.type == 'slow_motion' and YELLOW or RED, 8
                     )
-                    self.powerups.remove(powerup)
-                
-                # 移除离开屏幕的道具
-                if powerup.is_off_screen():
-                    self.powerups.remove(powerup)
+
+                # 已收集或离开屏幕的道具不再保留
+                keep = (pu_x + pu_w >= 0) & ~got
+                if not keep.all():
+                    self.powerups = [p for p, k in zip(self.powerups, keep) if k]
             
             # 检查小鸟是否撞到地面或天花板
             if self.bird.y + self.bird.height >= SCREEN_HEIGHT or self.bird.y <= 0:
@@ -1527,19 +2026,20 @@ class Game:
     
     def draw(self):
         """绘制游戏画面"""
-        self.screen.fill(SKY_BLUE)
-        
-        if self.state == "MENU":
-            self.draw_menu()
-        elif self.state == "PLAYING":
-            self.draw_game()
-        elif self.state == "GAME_OVER":
-            self.draw_game_over()
-        elif self.state == "SETTINGS":
-            self.draw_settings()
-        elif self.state == "DIFFICULTY_SELECT":
-            self.draw_difficulty_select()
-        
+        # 暂停画面完全静止：进入暂停的第一帧绘制并推送一次，之后不再重绘。
+        # 其余界面（菜单/设置/结算）的背景本身每帧都在动（天空呼吸、云、花），
+        # 脏矩形局部更新覆盖不了整屏动画，维持整帧flip
+        if self.state == "PLAYING" and self.paused and not self.countdown_active:
+            if not self._pause_frame_drawn:
+                self.draw_game()
+                pygame.display.flip()
+                self._pause_frame_drawn = True
+            return
+        self._pause_frame_drawn = False
+
+        # 每个状态的绘制都以整屏背景开场，无需先fill底色
+        self._draw_dispatch[self.state]()
+
         pygame.display.flip()
     
     def draw_menu(self):
@@ -1547,176 +2047,126 @@ class Game:
         # 绘制背景
         self.background.draw(self.screen)
         
-        # 标题
-        self.draw_text("飞翔的小鸟", self.big_font, BLACK, SCREEN_WIDTH//2, 100)
-        
-        # 菜单选项
-        menu_options = [
-            ("[1]", "开始游戏"),
-            ("[2]", "游戏设置"),
-            ("[3]", "退出游戏")
-        ]
-        
-        for i, (icon, option) in enumerate(menu_options):
-            y_pos = 220 + i * 80  # 调整到统一的起始位置
-            
-            # 选中状态的高亮背景
+        # 文字统一收集成(Surface, Rect)序列，最后批量blit
+        text_blits = [self._text_pair("飞翔的小鸟", self.big_font, BLACK, CX, 100)]
+
+        # 菜单选项（布局表见__init__）
+        for i, (icon, option, highlight_rect, y_pos) in enumerate(self._menu_layout):
+            # 选中状态的高亮背景（底色+描边预构建在一张Surface里，见__init__）
             if i == self.menu_selection:
-                # 调整高亮框位置，使其与文本垂直居中对齐
-                highlight_rect = pygame.Rect(SCREEN_WIDTH//2 - 200, y_pos - 20, 400, 50)
-                # 使用更透明的高亮背景
-                highlight_surface = pygame.Surface((400, 50))
-                highlight_surface.set_alpha(30)  # 降低透明度
-                highlight_surface.fill(YELLOW)
-                self.screen.blit(highlight_surface, (SCREEN_WIDTH//2 - 200, y_pos - 20))
-                pygame.draw.rect(self.screen, YELLOW, highlight_rect, 2)
-            
-            # 图标
-            icon_color = YELLOW if i == self.menu_selection else BLACK
-            self.draw_text(icon, self.font, icon_color, SCREEN_WIDTH//2 - 150, y_pos)
-            
-            # 选项文字
+                self.screen.blit(self._highlight_menu, highlight_rect)
+
+            # 图标和选项文字
             option_color = YELLOW if i == self.menu_selection else BLACK
-            self.draw_text(option, self.font, option_color, SCREEN_WIDTH//2, y_pos)
-        
+            text_blits.append(self._text_pair(icon, self.font, option_color, CX - 150, y_pos))
+            text_blits.append(self._text_pair(option, self.font, option_color, CX, y_pos))
+
         # 操作提示
-        self.draw_text("使用 ↑↓ 方向键选择，回车键确认", self.small_font, GRAY, SCREEN_WIDTH//2, SCREEN_HEIGHT - 80)
-        
+        text_blits.append(self._text_pair("使用 ↑↓ 方向键选择，回车键确认", self.small_font, GRAY, CX, BOTTOM_HINT_Y))
+
         # 空格键提示
-        self.draw_text("或按空格键快速开始游戏", self.small_font, GRAY, SCREEN_WIDTH//2, SCREEN_HEIGHT - 50)
+        text_blits.append(self._text_pair("或按空格键快速开始游戏", self.small_font, GRAY, CX, BOTTOM_HINT_Y2))
+
+        batch_blit(self.screen, text_blits)
     
     def draw_settings(self):
         """绘制设置界面"""
         # 背景
         self.background.draw(self.screen)
         
-        # 左上角返回按钮
-        back_button_rect = pygame.Rect(20, 20, 80, 35)
-        pygame.draw.rect(self.screen, WHITE, back_button_rect)
-        pygame.draw.rect(self.screen, BLACK, back_button_rect, 2)
-        self.draw_text("← 返回", self.small_font, BLACK, 60, 37)
-        
-        # 标题
-        self.draw_text("游戏设置", self.title_font, BLACK, SCREEN_WIDTH//2, 100)
-        
-        # 设置选项
-        settings_data = [
-            ("[1]", "游戏难度"),
-            ("[2]", "音效音量"),
-            ("[3]", "返回主菜单")
-        ]
-        
-        for i, (icon, name) in enumerate(settings_data):
-            y_pos = 220 + i * 80  # 调整到统一的起始位置
-            
-            # 选中状态的高亮背景
+        # 左上角返回按钮（预构建，见__init__）
+        self.screen.blit(self._back_button_chrome, (20, 20))
+
+        # 文字统一收集成(Surface, Rect)序列，最后批量blit
+        text_blits = [self._text_pair("← 返回", self.small_font, BLACK, 60, 37),
+                      self._text_pair("游戏设置", self.title_font, BLACK, CX, 100)]
+
+        # 设置选项（布局表见__init__）
+        for i, (icon, name, highlight_rect, y_pos) in enumerate(self._settings_layout):
+            # 选中状态的高亮背景（底色+描边预构建在一张Surface里，见__init__）
             if i == self.settings_selection:
-                # 调整高亮框位置，使其与文本垂直居中对齐
-                highlight_rect = pygame.Rect(SCREEN_WIDTH//2 - 200, y_pos - 20, 400, 50)
-                # 使用更透明的高亮背景
-                highlight_surface = pygame.Surface((400, 50))
-                highlight_surface.set_alpha(30)  # 降低透明度
-                highlight_surface.fill(YELLOW)
-                self.screen.blit(highlight_surface, (SCREEN_WIDTH//2 - 200, y_pos - 20))
-                pygame.draw.rect(self.screen, YELLOW, highlight_rect, 2)
-            
-            # 图标
-            icon_color = YELLOW if i == self.settings_selection else BLACK
-            self.draw_text(icon, self.font, icon_color, SCREEN_WIDTH//2 - 150, y_pos)
-            
-            # 设置名称
+                self.screen.blit(self._highlight_menu, highlight_rect)
+
+            # 图标和设置名称
             name_color = YELLOW if i == self.settings_selection else BLACK
-            self.draw_text(name, self.font, name_color, SCREEN_WIDTH//2, y_pos)
-            
+            text_blits.append(self._text_pair(icon, self.font, name_color, CX - 150, y_pos))
+            text_blits.append(self._text_pair(name, self.font, name_color, CX, y_pos))
+
             # 特殊处理：音量滑块
             if i == 1:  # 音效音量选项
-                slider_x = SCREEN_WIDTH//2 + 80  # 增加与文字的距离
+                slider_x = CX + 80  # 增加与文字的距离
                 slider_y = y_pos - 10  # 调整到与文字同一高度（垂直居中）
                 slider_width = 200
                 slider_height = 20
-                
-                # 绘制滑块背景
-                pygame.draw.rect(self.screen, GRAY, (slider_x, slider_y, slider_width, slider_height))
-                pygame.draw.rect(self.screen, BLACK, (slider_x, slider_y, slider_width, slider_height), 2)
-                
+
+                # 绘制滑轨（预构建，见__init__）
+                self.screen.blit(self._slider_track, (slider_x, slider_y))
+
                 # 绘制滑块
                 slider_pos = int(slider_x + self.sound_manager.sound_volume * slider_width)
                 pygame.draw.rect(self.screen, YELLOW, (slider_pos - 5, slider_y - 2, 10, slider_height + 4))
                 
                 # 显示音量百分比
-                volume_text = self.small_font.render(f"{int(self.sound_manager.sound_volume * 100)}%", True, BLACK)
-                volume_rect = volume_text.get_rect(center=(slider_x + slider_width + 30, slider_y + slider_height//2))
-                self.screen.blit(volume_text, volume_rect)
-        
+                text_blits.append(self._text_pair(
+                    f"{int(self.sound_manager.sound_volume * 100)}%",
+                    self.small_font, BLACK,
+                    slider_x + slider_width + 30, slider_y + slider_height//2))
+
         # 操作提示
-        self.draw_text("使用 ↑↓ 方向键选择，Enter确认，ESC返回", self.small_font, GRAY, SCREEN_WIDTH//2, SCREEN_HEIGHT - 80)
-        
+        text_blits.append(self._text_pair("使用 ↑↓ 方向键选择，Enter确认，ESC返回", self.small_font, GRAY, CX, BOTTOM_HINT_Y))
+
         # 音量滑块提示
-        self.draw_text("音量：←→键或点击拖拽滑块调节", self.small_font, GRAY, SCREEN_WIDTH//2, SCREEN_HEIGHT - 50)
+        text_blits.append(self._text_pair("音量：←→键或点击拖拽滑块调节", self.small_font, GRAY, CX, BOTTOM_HINT_Y2))
+
+        batch_blit(self.screen, text_blits)
     
     def draw_difficulty_select(self):
         """绘制难度选择界面"""
         # 背景
         self.background.draw(self.screen)
         
-        # 左上角返回按钮
-        back_button_rect = pygame.Rect(20, 20, 80, 35)
-        pygame.draw.rect(self.screen, WHITE, back_button_rect)
-        pygame.draw.rect(self.screen, BLACK, back_button_rect, 2)
-        self.draw_text("← 返回", self.small_font, BLACK, 60, 37)
-        
-        # 标题
-        self.draw_text("选择难度", self.title_font, BLACK, SCREEN_WIDTH//2, 100)
-        
-        # 难度选项
-        difficulties = list(DIFFICULTY_SETTINGS.keys())
-        difficulty_descriptions = {
-            "简单": "管道间距大，移动慢，适合新手",
-            "中等": "平衡的难度，适合大多数玩家",
-            "难": "管道间距小，移动快，极具挑战"
-        }
-        
-        for i, difficulty in enumerate(difficulties):
-            y_pos = 220 + i * 100  # 调整到统一的起始位置
-            
-            # 选中状态的高亮背景
+        # 左上角返回按钮（预构建，见__init__）
+        self.screen.blit(self._back_button_chrome, (20, 20))
+
+        # 文字统一收集成(Surface, Rect)序列，最后批量blit
+        text_blits = [self._text_pair("← 返回", self.small_font, BLACK, 60, 37),
+                      self._text_pair("选择难度", self.title_font, BLACK, CX, 100)]
+
+        # 难度选项（布局表见__init__）
+        for i, (difficulty, description, highlight_rect, y_pos) in enumerate(self._difficulty_layout):
+            # 选中状态的高亮背景（底色+描边预构建在一张Surface里，见__init__）
             if i == self.difficulty_selection:
-                # 调整高亮框位置，使其与文本垂直居中对齐
-                highlight_rect = pygame.Rect(SCREEN_WIDTH//2 - 250, y_pos - 25, 500, 70)
-                # 使用更透明的高亮背景
-                highlight_surface = pygame.Surface((500, 70))
-                highlight_surface.set_alpha(30)  # 降低透明度
-                highlight_surface.fill(YELLOW)
-                self.screen.blit(highlight_surface, (SCREEN_WIDTH//2 - 250, y_pos - 25))
-                pygame.draw.rect(self.screen, YELLOW, highlight_rect, 2)
-            
+                self.screen.blit(self._highlight_difficulty, highlight_rect)
+
             # 难度名称
             difficulty_color = YELLOW if i == self.difficulty_selection else BLACK
-            self.draw_text(difficulty, self.font, difficulty_color, SCREEN_WIDTH//2, y_pos)
-            
+            text_blits.append(self._text_pair(difficulty, self.font, difficulty_color, CX, y_pos))
+
             # 难度描述
-            self.draw_text(difficulty_descriptions[difficulty], self.small_font, GRAY, SCREEN_WIDTH//2, y_pos + 25)
-            
+            text_blits.append(self._text_pair(description, self.small_font, GRAY, CX, y_pos + 25))
+
             # 当前选中的难度标记
             if difficulty == self.difficulty:
-                self.draw_text("(当前)", self.small_font, GREEN, SCREEN_WIDTH//2 + 100, y_pos)
-        
+                text_blits.append(self._text_pair("(当前)", self.small_font, GREEN, CX + 100, y_pos))
+
         # 操作提示
-        self.draw_text("使用 ↑↓ 方向键选择，Enter直接开始游戏，ESC返回", self.small_font, GRAY, SCREEN_WIDTH//2, SCREEN_HEIGHT - 80)
+        text_blits.append(self._text_pair("使用 ↑↓ 方向键选择，Enter直接开始游戏，ESC返回", self.small_font, GRAY, CX, BOTTOM_HINT_Y))
+
+        batch_blit(self.screen, text_blits)
     
     def draw_game(self):
         """绘制游戏画面"""
         # 绘制背景
         self.background.draw(self.screen)
         
-        # 绘制管道
+        # 绘制管道和道具：收集成一个(Surface, 位置)序列后一次批量blit
+        entity_blits = []
         for pipe in self.pipes:
-            pipe.draw(self.screen)
-        
-        # 绘制道具
+            entity_blits.extend(pipe.blit_pairs())
         for powerup in self.powerups:
-            powerup.draw(self.screen)
-        
+            entity_blits.append(powerup.blit_pair())
+        batch_blit(self.screen, entity_blits)
+
         # 绘制粒子效果
         self.particle_system.draw(self.screen)
         
@@ -1724,12 +2174,19 @@ class Game:
         if self.bird:
             self.bird.draw(self.screen)
             
-            # 绘制护盾效果
+            # 绘制护盾效果：圆环只光栅化一次，之后按小鸟位置blit
             if self.shield_active:
-                pygame.draw.circle(self.screen, BLUE, 
-                                 (self.bird.x + self.bird.width//2, 
-                                  self.bird.y + self.bird.height//2), 
-                                 self.bird.width//2 + 10, 3)
+                radius = self.bird.width//2 + 10
+                sprite = self._shield_sprites.get(radius)
+                if sprite is None:
+                    size = radius * 2 + 4
+                    sprite = pygame.Surface((size, size), pygame.SRCALPHA)
+                    pygame.draw.circle(sprite, BLUE, (size//2, size//2), radius, 3)
+                    sprite = sprite.convert_alpha()
+                    self._shield_sprites[radius] = sprite
+                half = sprite.get_width() // 2
+                self.screen.blit(sprite, (self.bird.x + self.bird.width//2 - half,
+                                          self.bird.y + self.bird.height//2 - half))
         
         # 绘制UI信息
         self.draw_game_ui()
@@ -1742,66 +2199,82 @@ class Game:
         if self.countdown_active:
             self.draw_countdown()
     
+    def _hud_surf(self, slot, value, prefix, suffix, font, color):
+        """按槽位缓存的HUD文字：值没变时直接复用上次渲染的Surface"""
+        cached = self._hud_cache.get(slot)
+        if cached is None or cached[0] != value:
+            cached = (value, font.render(f"{prefix}{value}{suffix}", True, color))
+            self._hud_cache[slot] = cached
+        return cached[1]
+
+    def _glyph(self, piece, font, color):
+        """按(文字片段, 字体, 颜色)缓存的字形/片段Surface"""
+        key = (piece, id(font), color)
+        surf = self._glyph_cache.get(key)
+        if surf is None:
+            surf = font.render(piece, True, color)
+            self._glyph_cache[key] = surf
+        return surf
+
+    def _append_hud_number(self, blits, prefix, value, suffix, font, color, x, y):
+        """前缀/后缀整段缓存，数字逐字形拼装——任何新数值都不触发FreeType渲染"""
+        surf = self._glyph(prefix, font, color)
+        blits.append((surf, (x, y)))
+        x += surf.get_width()
+        for ch in str(value):
+            surf = self._glyph(ch, font, color)
+            blits.append((surf, (x, y)))
+            x += surf.get_width()
+        if suffix:
+            blits.append((self._glyph(suffix, font, color), (x, y)))
+
     def draw_game_ui(self):
-        """绘制游戏UI"""
+        """绘制游戏UI（全部HUD文字收集成一批blit，目标Surface只加锁一次）"""
+        blits = []
+
         # 绘制分数
-        score_text = self.font.render(f"分数: {self.score}", True, BLACK)
-        self.screen.blit(score_text, (10, 10))
-        
+        self._append_hud_number(blits, "分数: ", self.score, "", self.font, BLACK, 10, 10)
+
         # 绘制最高分
-        high_score_text = self.font.render(f"最高分: {self.high_score}", True, BLACK)
-        self.screen.blit(high_score_text, (10, 50))
-        
+        self._append_hud_number(blits, "最高分: ", self.high_score, "", self.font, BLACK, 10, 50)
+
         # 绘制难度
-        difficulty_text = self.font.render(f"难度: {self.difficulty}", True, BLACK)
-        self.screen.blit(difficulty_text, (10, 90))
-        
-        # 绘制状态指示器
+        blits.append((self._hud_surf('difficulty', self.difficulty, "难度: ", "", self.font, BLACK), (10, 90)))
+
+        # 绘制状态指示器（剩余秒数每秒才变一次）
         y_offset = 130
         if self.shield_active:
-            shield_text = self.font.render(f"护盾: {self.shield_timer//60 + 1}秒", True, BLUE)
-            self.screen.blit(shield_text, (10, y_offset))
+            self._append_hud_number(blits, "护盾: ", self.shield_timer//60 + 1, "秒", self.font, BLUE, 10, y_offset)
             y_offset += 30
-            
+
         if self.slow_motion_active:
-            slow_text = self.font.render(f"慢动作: {self.slow_motion_timer//60 + 1}秒", True, YELLOW)
-            self.screen.blit(slow_text, (10, y_offset))
+            self._append_hud_number(blits, "慢动作: ", self.slow_motion_timer//60 + 1, "秒", self.font, YELLOW, 10, y_offset)
             y_offset += 30
-            
+
         if self.double_score_active:
-            double_text = self.font.render(f"双倍分数: {self.double_score_timer//60 + 1}秒", True, RED)
-            self.screen.blit(double_text, (10, y_offset))
+            self._append_hud_number(blits, "双倍分数: ", self.double_score_timer//60 + 1, "秒", self.font, RED, 10, y_offset)
+
+        batch_blit(self.screen, blits)
     
     def draw_pause_screen(self):
         """绘制暂停界面"""
-        # 半透明覆盖层
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-        overlay.set_alpha(128)
-        overlay.fill(BLACK)
-        self.screen.blit(overlay, (0, 0))
-        
+        # 半透明覆盖层（模块级惰性单例）
+        self.screen.blit(get_dim_overlay(), (0, 0))
+
         # 暂停文字
-        pause_text = self.big_font.render("游戏暂停", True, WHITE)
-        pause_rect = pause_text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2 - 50))
-        self.screen.blit(pause_text, pause_rect)
-        
+        self.draw_text("游戏暂停", self.big_font, WHITE, CX, CY - 50)
+
         # 继续提示
-        continue_text = self.font.render("按ESC继续游戏", True, WHITE)
-        continue_rect = continue_text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2 + 50))
-        self.screen.blit(continue_text, continue_rect)
+        self.draw_text("按ESC继续游戏", self.font, WHITE, CX, CY + 50)
     
     def draw_countdown(self):
         """绘制倒计时"""
-        # 半透明覆盖层
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-        overlay.set_alpha(128)
-        overlay.fill(BLACK)
-        self.screen.blit(overlay, (0, 0))
-        
-        # 倒计时文字 - 使用更大的字体
-        countdown_text = self.countdown_font.render(self.countdown_text, True, WHITE)
-        countdown_rect = countdown_text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2))
-        self.screen.blit(countdown_text, countdown_rect)
+        # 半透明覆盖层（模块级惰性单例）
+        self.screen.blit(get_dim_overlay(), (0, 0))
+
+        # 倒计时文字 - 使用更大的字体（只有3/2/1三种，全部命中缓存）
+        self.draw_text(self.countdown_text, self.countdown_font, WHITE,
+                       CX, CY)
     
     def draw_game_over(self):
         """绘制游戏结束画面"""
@@ -1809,8 +2282,10 @@ class Game:
         self.background.draw(self.screen)
         
         # 绘制管道（让玩家看到死在哪里）
+        pipe_blits = []
         for pipe in self.pipes:
-            pipe.draw(self.screen)
+            pipe_blits.extend(pipe.blit_pairs())
+        batch_blit(self.screen, pipe_blits)
         
         # 绘制小鸟（显示死亡位置）
         if self.bird:
@@ -1821,29 +2296,20 @@ class Game:
         self.particle_system.draw(self.screen)
         
         # 游戏结束文字（标题）
-        game_over_text = self.big_font.render("游戏结束", True, RED)
-        game_over_rect = game_over_text.get_rect(center=(SCREEN_WIDTH//2, 150))
-        self.screen.blit(game_over_text, game_over_rect)
-        
+        self.draw_text("游戏结束", self.big_font, RED, CX, 150)
+
         # 显示最终分数（与下面的文字在一起）
-        final_score_text = self.font.render(f"最终分数: {self.score}", True, BLACK)
-        final_score_rect = final_score_text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2 - 30))
-        self.screen.blit(final_score_text, final_score_rect)
-        
+        self.draw_text(f"最终分数: {self.score}", self.font, BLACK,
+                       CX, CY - 30)
+
         # 显示最高分
         if self.score == self.high_score and self.score > 0:
-            new_record_text = self.font.render("新纪录！", True, YELLOW)
-            new_record_rect = new_record_text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2 + 10))
-            self.screen.blit(new_record_text, new_record_rect)
-        
+            self.draw_text("新纪录！", self.font, YELLOW, CX, CY + 10)
+
         # 提示：空格再来一次 / ESC返回主菜单
-        retry_text = self.font.render("按 空格 再来一次", True, BLACK)
-        retry_rect = retry_text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2 + 60))
-        self.screen.blit(retry_text, retry_rect)
-        
-        back_text = self.small_font.render("按 ESC 返回主菜单", True, GRAY)
-        back_rect = back_text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2 + 100))
-        self.screen.blit(back_text, back_rect)
+        self.draw_text("按 空格 再来一次", self.font, BLACK, CX, CY + 60)
+
+        self.draw_text("按 ESC 返回主菜单", self.small_font, GRAY, CX, CY + 100)
     
     def run(self):
         """主游戏循环"""
@@ -1851,7 +2317,8 @@ class Game:
             self.handle_events()
             self.update()
             self.draw()
-            self.clock.tick(FPS)
+            # 菜单/暂停等非对局画面降到30帧，省下一半的重绘开销
+            self.clock.tick(FPS if self.state == "PLAYING" and not self.paused else 30)
         
         pygame.quit()
         sys.exit()